@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-import json
-from collections.abc import Mapping
+import math
+from collections.abc import Mapping, Sequence
 from pathlib import Path
 from typing import Any
 
-from phys_sims_utils.harness import InMemoryTestHarness, SweepSpec
+import numpy as np
+
+from phys_sims_utils.harness import InMemoryTestHarness, SweepSpec, save_summary
 from phys_sims_utils.harness.adapters.phys_pipeline import PhysPipelineAdapter
 from phys_sims_utils.harness.plotting import (
     plot_convergence_best_so_far,
@@ -22,15 +24,21 @@ from phys_sims_utils.ml.strategies import RandomStrategy
 class DummyPipeline:
     """Simple deterministic stand-in for an external simulation pipeline."""
 
+    TARGET_A = 0.35
+    TARGET_B = 0.75
+
     def run(self, config: Mapping[str, Any], seed: int) -> Mapping[str, Any]:
-        alpha = float(config["alpha"])
-        beta = float(config["beta"])
-        target_a = 0.35
-        target_b = 0.75
-
-        objective = (alpha - target_a) ** 2 + (beta - target_b) ** 2
-        rmse = objective**0.5
-        mae = (abs(alpha - target_a) + abs(beta - target_b)) / 2.0
+        return self._kernel(config["alpha"], config["beta"], seed)
+
+    @staticmethod
+    def _kernel(alpha: float, beta: float, seed: int) -> Mapping[str, Any]:
+        """Scalar fallback for one point; sweeps go through ``run_batch``."""
+        diff_a = alpha - DummyPipeline.TARGET_A
+        diff_b = beta - DummyPipeline.TARGET_B
+
+        objective = diff_a * diff_a + diff_b * diff_b
+        rmse = math.sqrt(objective)
+        mae = (abs(diff_a) + abs(diff_b)) / 2.0
         return {
             "objective": objective,
             "rmse": rmse,
@@ -38,6 +46,26 @@ class DummyPipeline:
             "seed_echo": float(seed),
         }
 
+    def run_batch(
+        self, configs: Sequence[Mapping[str, Any]], seeds: Sequence[int]
+    ) -> list[Mapping[str, Any]]:
+        """Vectorized equivalent of ``run`` over a whole sweep."""
+        count = len(configs)
+        alpha = np.fromiter((float(c["alpha"]) for c in configs), dtype=np.float64, count=count)
+        beta = np.fromiter((float(c["beta"]) for c in configs), dtype=np.float64, count=count)
+        diff_a = alpha - self.TARGET_A
+        diff_b = beta - self.TARGET_B
+
+        objective = diff_a * diff_a + diff_b * diff_b
+        rmse = np.sqrt(objective)
+        mae = (np.abs(diff_a) + np.abs(diff_b)) / 2.0
+        return [
+            {"objective": obj, "rmse": err, "mae": abs_err, "seed_echo": float(seed)}
+            for obj, err, abs_err, seed in zip(
+                objective.tolist(), rmse.tolist(), mae.tolist(), seeds, strict=True
+            )
+        ]
+
 
 def run_example(output_dir: Path) -> dict[str, Path]:
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -45,10 +73,7 @@ def run_example(output_dir: Path) -> dict[str, Path]:
     adapter = PhysPipelineAdapter(
         pipeline=DummyPipeline(),
         objective_key="objective",
-        metric_extractors={
-            "rmse": lambda output: float(output["rmse"]),
-            "mae": lambda output: float(output["mae"]),
-        },
+        metric_extractors={"rmse": "rmse", "mae": "mae"},
     )
 
     harness = InMemoryTestHarness(name="dummy-e2e")
@@ -119,8 +144,7 @@ def run_example(output_dir: Path) -> dict[str, Path]:
         "sweep_config_hash": sweep_result.config_hash,
         "sweep_provenance": sweep_result.provenance,
     }
-    metadata_json = json.dumps(metadata_payload, sort_keys=True, indent=2)
-    metadata_path.write_text(metadata_json, encoding="utf-8")
+    save_summary(metadata_payload, metadata_path)
 
     return {
         "sweep_table": sweep_table_path,
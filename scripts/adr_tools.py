@@ -1,24 +1,35 @@
 #!/usr/bin/env python3
 import argparse
 import datetime as dt
-import glob
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 ADR_DIR = os.path.join(ROOT, "docs", "adr")
 INDEX = os.path.join(ADR_DIR, "INDEX.md")
 
-# Matches:
+# Matches (prefix group is None for the numeric series):
 #   0001-some-title.md
 #   ECO-0001-some-title.md
-RE_NUMERIC = re.compile(r"^(?P<num>[0-9]{4})-(?P<slug>.+)\.md$")
-RE_PREFIXED = re.compile(r"^(?P<prefix>[A-Z]{2,8})-(?P<num>[0-9]{4})-(?P<slug>.+)\.md$")
+RE_ADR = re.compile(r"^(?:(?P<prefix>[A-Z]{2,8})-)?(?P<num>[0-9]{4})-(?P<slug>.+)\.md$")
+
+RE_SLUG_NONALNUM = re.compile(r"[^a-z0-9]+")
+RE_SLUG_DASHES = re.compile(r"-+")
+# Markdown metadata lines like "- **Status:** Accepted" and the H1 title fallback.
+RE_MD_KV = re.compile(r"^\s*(?:[-*]\s*)?\*\*(.+?):\*\*\s*(.+?)\s*$")
+RE_MD_H1 = re.compile(r"^#\s+(.+)$")
+
+# Bound format_map methods for INDEX rows; rows are plain dicts keyed by column.
+FORMAT_ROW = "| {ref} | {title} | {status} | {date} | {area} | {tags} |\n".format_map
+FORMAT_ROW_IMPACTED = (
+    "| {ref} | {title} | {status} | {date} | {area} | {impacted} | {tags} |\n".format_map
+)
 
 
 def slugify(s: str) -> str:
-    return re.sub(r"-+", "-", re.sub(r"[^a-z0-9]+", "-", s.lower())).strip("-")
+    return RE_SLUG_DASHES.sub("-", RE_SLUG_NONALNUM.sub("-", s.lower())).strip("-")
 
 
 def iter_adr_files(series: str):
@@ -30,30 +41,30 @@ def iter_adr_files(series: str):
     """
     os.makedirs(ADR_DIR, exist_ok=True)
 
-    for p in glob.glob(os.path.join(ADR_DIR, "*.md")):
-        base = os.path.basename(p)
+    with os.scandir(ADR_DIR) as entries:
+        for entry in entries:
+            base = entry.name
+
+            # skip non-markdown, hidden files (as glob did), templates + index
+            if not base.endswith(".md") or base.startswith((".", "_template-")):
+                continue
+            if base.upper() == "INDEX.MD":
+                continue
+
+            m = RE_ADR.match(base)
+            if not m:
+                continue
+            prefix = m.group("prefix")
 
-        # skip templates + index
-        if base.startswith("_template-"):
-            continue
-        if base.upper() == "INDEX.MD":
-            continue
-
-        m_num = RE_NUMERIC.match(base)
-        m_pre = RE_PREFIXED.match(base)
-
-        if series == "numeric":
-            if m_num:
-                yield p, None, int(m_num.group("num"))
-        elif series == "all":
-            if m_num:
-                yield p, None, int(m_num.group("num"))
-            elif m_pre:
-                yield p, m_pre.group("prefix"), int(m_pre.group("num"))
-        else:
-            # series treated as an exact prefix like "ECO" / "INT"
-            if m_pre and m_pre.group("prefix") == series:
-                yield p, m_pre.group("prefix"), int(m_pre.group("num"))
+            if series == "numeric":
+                keep = prefix is None
+            elif series == "all":
+                keep = True
+            else:
+                # series treated as an exact prefix like "ECO" / "INT"
+                keep = prefix == series
+            if keep:
+                yield entry.path, prefix, int(m.group("num"))
 
 
 def next_id(series: str) -> str:
@@ -64,34 +75,57 @@ def next_id(series: str) -> str:
 
 
 def read_front_matter(path):
-    meta = {}
-    with open(path, encoding="utf-8") as f:
-        s = f.read()
-    if s.startswith("---"):
-        parts = s.split("\n---", 1)
-        if len(parts) > 1:
-            fm = parts[0].lstrip("-\n")
-            for line in fm.splitlines():
-                if ":" in line:
-                    k, v = line.split(":", 1)
-                    meta[k.strip().lower()] = v.strip().strip('"').strip("'")
+    """Parse ADR metadata in one streaming pass over the file.
+
+    Front-matter ``key: value`` lines win over markdown ``**Key:** value`` lines;
+    the first H1 is the title fallback. Reading stops once every known key is set.
+    """
     allowed_keys = {"title", "status", "date", "area", "tags", "impacted_repos"}
-    md_kv = re.compile(r"^\s*(?:[-*]\s*)?\*\*(.+?):\*\*\s*(.+?)\s*$")
-    for line in s.splitlines():
-        m = md_kv.match(line)
-        if not m:
-            continue
-        key = m.group(1).strip().lower()
-        if key not in allowed_keys:
-            continue
-        value = m.group(2).strip().strip("`")
+
+    fm_meta = {}
+    md_meta = {}
+    h1_title = None
+    # Front-matter lines are only committed once the closing '---' is seen.
+    pending = None
+
+    with open(path, encoding="utf-8") as f:
+        for index, raw in enumerate(f):
+            line = raw.rstrip("\n")
+
+            if index == 0 and line.startswith("---"):
+                pending = [line]
+            elif pending is not None:
+                if line.startswith("---"):
+                    fm = "\n".join(pending).lstrip("-\n")
+                    for fm_line in fm.splitlines():
+                        if ":" in fm_line:
+                            k, v = fm_line.split(":", 1)
+                            fm_meta[k.strip().lower()] = v.strip().strip('"').strip("'")
+                    pending = None
+                else:
+                    pending.append(line)
+
+            m = RE_MD_KV.match(line)
+            if m:
+                key = m.group(1).strip().lower()
+                if key in allowed_keys:
+                    md_meta.setdefault(key, m.group(2).strip().strip("`"))
+
+            if h1_title is None:
+                m = RE_MD_H1.match(line)
+                if m:
+                    h1_title = m.group(1).strip()
+
+            if pending is None and allowed_keys <= fm_meta.keys() | md_meta.keys():
+                break
+
+    meta = fm_meta
+    for key, value in md_meta.items():
         meta.setdefault(key, value)
 
     # fallback: first markdown H1 as title
-    if "title" not in meta:
-        m = re.search(r"^#\s+(.+)$", s, flags=re.M)
-        if m:
-            meta["title"] = m.group(1).strip()
+    if "title" not in meta and h1_title is not None:
+        meta["title"] = h1_title
     return meta
 
 
@@ -144,53 +178,52 @@ def cmd_new(args):
 def cmd_reindex(args):
     rows = []
 
-    for p, prefix, n in sorted(iter_adr_files(args.series), key=lambda t: ((t[1] or "ADR"), t[2])):
-        base = os.path.basename(p)
-        meta = read_front_matter(p)
-
-        title = meta.get("title", base)
-        status = meta.get("status", "")
-        date = meta.get("date", "")
-        area = meta.get("area", "")
-        tags = meta.get("tags", "")
+    files = sorted(iter_adr_files(args.series), key=lambda t: ((t[1] or "ADR"), t[2]))
+    # Reads are I/O-bound; map() keeps results in the sorted file order.
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        metas = list(ex.map(read_front_matter, (p for p, _prefix, _n in files)))
 
-        # Optional: if you add "impacted_repos:" to front matter in ECO ADRs
-        impacted = meta.get("impacted_repos", "")
-
-        link = base
+    for (p, prefix, n), meta in zip(files, metas, strict=True):
+        base = os.path.basename(p)
 
         label = f"{prefix}-{n:04d}" if prefix else f"ADR-{n:04d}"
-        ref = f"[{label}]({link})"
-
-        # If series is a single prefix (e.g., ECO), include impacted column;
-        # otherwise keep old shape.
-        if args.series not in ("numeric", "all"):
-            rows.append((label, ref, title, status, date, area, impacted, tags))
-        else:
-            rows.append((label, ref, title, status, date, area, tags))
+        rows.append(
+            {
+                "ref": f"[{label}]({base})",
+                "title": meta.get("title", base),
+                "status": meta.get("status", ""),
+                "date": meta.get("date", ""),
+                "area": meta.get("area", ""),
+                # Optional: if you add "impacted_repos:" to front matter in ECO ADRs
+                "impacted": meta.get("impacted_repos", ""),
+                "tags": meta.get("tags", ""),
+            }
+        )
 
+    # If series is a single prefix (e.g., ECO), include impacted column;
+    # otherwise keep old shape.
     if args.series not in ("numeric", "all"):
-        lines = [
+        header = [
             f"# {args.series} ADR Index",
             "",
             "| ADR | Title | Status | Date | Area | Impacted repos | Tags |",
             "|---:|---|---|---|---|---|---|",
         ]
-        for _label, ref, t, s, d, ar, imp, tg in rows:
-            lines.append(f"| {ref} | {t} | {s} | {d} | {ar} | {imp} | {tg} |")
+        body = map(FORMAT_ROW_IMPACTED, rows)
     else:
-        lines = [
+        header = [
             "# ADR Index",
             "",
             "| ADR | Title | Status | Date | Area | Tags |",
             "|---:|---|---|---|---|---|",
         ]
-        for _label, ref, t, s, d, ar, tg in rows:
-            lines.append(f"| {ref} | {t} | {s} | {d} | {ar} | {tg} |")
+        body = map(FORMAT_ROW, rows)
 
     os.makedirs(ADR_DIR, exist_ok=True)
-    with open(INDEX, "w", encoding="utf-8", newline="\n") as f:
-        f.write("\n".join(lines) + "\n")
+    # Stream rows straight into the buffered handle instead of joining one big string.
+    with open(INDEX, "w", encoding="utf-8", newline="\n", buffering=1 << 16) as f:
+        f.write("\n".join(header) + "\n")
+        f.writelines(body)
 
     print(f"Updated {os.path.relpath(INDEX, ROOT)} with {len(rows)} ADRs")
 
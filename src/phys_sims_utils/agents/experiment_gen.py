@@ -6,6 +6,7 @@ import hashlib
 import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -32,14 +33,20 @@ class ScriptProvenance:
     generator: str = "phys_sims_utils.agents.experiment_gen"
 
     def to_json(self) -> str:
-        return json.dumps(
-            {
-                "generator": self.generator,
-                "git_commit": self.git_commit,
-                "package_version": self.package_version,
-            },
-            sort_keys=True,
-        )
+        return _provenance_json(self)
+
+
+@lru_cache(maxsize=64)
+def _provenance_json(provenance: ScriptProvenance) -> str:
+    # Frozen string-only fields make provenance hashable; script batches share one record.
+    return json.dumps(
+        {
+            "generator": provenance.generator,
+            "git_commit": provenance.git_commit,
+            "package_version": provenance.package_version,
+        },
+        sort_keys=True,
+    )
 
 
 def generate_experiment_script(
@@ -108,7 +115,15 @@ def _render_script(
     )
 
 
+# ASCII characters that are not alphanumeric, "_" or "-"; translate() leaves all others as-is.
+_UNSAFE_ASCII = str.maketrans(
+    {chr(code): "_" for code in range(128) if not chr(code).isalnum() and chr(code) not in "_-"}
+)
+
+
 def _safe_filename(name: str) -> str:
+    if name.isascii():
+        return name.translate(_UNSAFE_ASCII)
     return "".join(char if char.isalnum() or char in {"_", "-"} else "_" for char in name)
 
 
@@ -3,10 +3,30 @@
 from __future__ import annotations
 
 import ast
+import re
 from collections.abc import Iterable
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
 from pathlib import Path
 
+_SEED_POLICY_MARKER = "# seed_policy:"
+_SEED_ARGUMENT_MARKER = "def main(*, seed: int)"
+_CONFIG_HASH_MARKER = "# config_hash:"
+_PROVENANCE_MARKER = "# provenance:"
+_STRUCTURE_FIELDS_MARKER = "# structure_fields:"
+_MARKERS_RE = re.compile(
+    b"|".join(
+        re.escape(marker.encode("ascii"))
+        for marker in (
+            _SEED_POLICY_MARKER,
+            _SEED_ARGUMENT_MARKER,
+            _CONFIG_HASH_MARKER,
+            _PROVENANCE_MARKER,
+            _STRUCTURE_FIELDS_MARKER,
+        )
+    )
+)
+
 
 @dataclass(frozen=True)
 class RepoIssue:
@@ -31,29 +51,39 @@ def check_script_metadata(
 ) -> RepoCheckResult:
     """Run script-level checks for seed/config/provenance and parameter path validity."""
     path = Path(script_path)
-    source = path.read_text(encoding="utf-8")
+    # Markers are ASCII, so scan raw bytes and let ast.parse handle decoding when needed.
+    source = path.read_bytes()
 
+    markers = _present_markers(source)
     issue_list: list[RepoIssue] = []
-    issue_list.extend(_check_missing_seeds(source))
-    issue_list.extend(_check_missing_config_hash_or_provenance(source))
-    issue_list.extend(_check_missing_structure_metadata(source))
-    issue_list.extend(
-        _check_invalid_parameter_paths(source, valid_paths=set(valid_parameter_paths))
+    issue_list.extend(_check_missing_seeds(markers))
+    issue_list.extend(_check_missing_config_hash_or_provenance(markers))
+    issue_list.extend(_check_missing_structure_metadata(markers))
+    valid_paths = (
+        valid_parameter_paths
+        if isinstance(valid_parameter_paths, (set, frozenset))
+        else frozenset(valid_parameter_paths)
     )
+    issue_list.extend(_check_invalid_parameter_paths(source, valid_paths=valid_paths))
 
     return RepoCheckResult(path=path, issues=tuple(issue_list))
 
 
-def _check_missing_seeds(source: str) -> list[RepoIssue]:
+def _present_markers(source: bytes) -> frozenset[str]:
+    """Collect all metadata markers present in ``source`` with one regex scan."""
+    return frozenset(match.group(0).decode("ascii") for match in _MARKERS_RE.finditer(source))
+
+
+def _check_missing_seeds(markers: frozenset[str]) -> list[RepoIssue]:
     issues: list[RepoIssue] = []
-    if "# seed_policy:" not in source:
+    if _SEED_POLICY_MARKER not in markers:
         issues.append(
             RepoIssue(
                 code="missing-seed-policy",
                 message="Missing '# seed_policy:' metadata header.",
             )
         )
-    if "def main(*, seed: int)" not in source:
+    if _SEED_ARGUMENT_MARKER not in markers:
         issues.append(
             RepoIssue(
                 code="missing-seed-argument",
@@ -63,16 +93,16 @@ def _check_missing_seeds(source: str) -> list[RepoIssue]:
     return issues
 
 
-def _check_missing_config_hash_or_provenance(source: str) -> list[RepoIssue]:
+def _check_missing_config_hash_or_provenance(markers: frozenset[str]) -> list[RepoIssue]:
     issues: list[RepoIssue] = []
-    if "# config_hash:" not in source:
+    if _CONFIG_HASH_MARKER not in markers:
         issues.append(
             RepoIssue(
                 code="missing-config-hash",
                 message="Missing '# config_hash:' metadata header.",
             )
         )
-    if "# provenance:" not in source:
+    if _PROVENANCE_MARKER not in markers:
         issues.append(
             RepoIssue(
                 code="missing-provenance",
@@ -82,8 +112,8 @@ def _check_missing_config_hash_or_provenance(source: str) -> list[RepoIssue]:
     return issues
 
 
-def _check_missing_structure_metadata(source: str) -> list[RepoIssue]:
-    if "# structure_fields:" not in source:
+def _check_missing_structure_metadata(markers: frozenset[str]) -> list[RepoIssue]:
+    if _STRUCTURE_FIELDS_MARKER not in markers:
         return [
             RepoIssue(
                 code="missing-structure-metadata",
@@ -93,11 +123,16 @@ def _check_missing_structure_metadata(source: str) -> list[RepoIssue]:
     return []
 
 
-def _check_invalid_parameter_paths(source: str, *, valid_paths: set[str]) -> list[RepoIssue]:
+def _check_invalid_parameter_paths(
+    source: bytes, *, valid_paths: AbstractSet[str]
+) -> list[RepoIssue]:
     try:
         tree = ast.parse(source)
     except SyntaxError:
         return [RepoIssue(code="invalid-python", message="Script is not valid Python syntax.")]
+    # Every script is syntax-checked; only the declaration lookup is skipped without the marker.
+    if b"PARAMETER_PATHS" not in source:
+        return []
 
     declared_paths = _extract_parameter_paths(tree)
     invalid_paths = sorted(path for path in declared_paths if path not in valid_paths)
@@ -113,15 +148,29 @@ def _check_invalid_parameter_paths(source: str, *, valid_paths: set[str]) -> lis
 def _extract_parameter_paths(tree: ast.AST) -> tuple[str, ...]:
     if not isinstance(tree, ast.Module):
         return ()
-    for node in tree.body:
-        if not isinstance(node, ast.Assign):
-            continue
-        for target in node.targets:
-            if isinstance(target, ast.Name) and target.id == "PARAMETER_PATHS":
-                literal = ast.literal_eval(node.value)
-                if isinstance(literal, tuple):
-                    values = tuple(str(item) for item in literal)
-                    return tuple(sorted(values))
+    node = next(
+        (
+            statement
+            for statement in tree.body
+            if isinstance(statement, ast.Assign)
+            and any(
+                isinstance(target, ast.Name) and target.id == "PARAMETER_PATHS"
+                for target in statement.targets
+            )
+        ),
+        None,
+    )
+    if node is None:
+        return ()
+    value = node.value
+    if isinstance(value, ast.Tuple):
+        # Common generated form: read constants directly instead of re-walking via literal_eval.
+        constants = [elt.value for elt in value.elts if isinstance(elt, ast.Constant)]
+        if len(constants) == len(value.elts):
+            return tuple(sorted(str(item) for item in constants))
+    literal = ast.literal_eval(value)
+    if isinstance(literal, tuple):
+        return tuple(sorted(str(item) for item in literal))
     return ()
 
 
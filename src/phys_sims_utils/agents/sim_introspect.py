@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import ast
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -53,6 +54,13 @@ def _build_test_hints(*, modules: list[Path], test_stems: set[str], root: Path)
 
 
 def _symbol_counts(module_path: Path) -> tuple[int, int]:
+    stat = module_path.stat()
+    return _cached_symbol_counts(module_path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=2048)
+def _cached_symbol_counts(module_path: Path, mtime_ns: int, size: int) -> tuple[int, int]:
+    # mtime/size only key the cache so edited files are parsed again.
     tree = ast.parse(module_path.read_text(encoding="utf-8"))
     functions = 0
     classes = 0
@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, field
+import os
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, is_dataclass
+from functools import lru_cache, partial
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Literal, TypeVar
 
 from phys_sims_utils.agents.repo_checks import RepoIssue, check_script_metadata
 from phys_sims_utils.harness import (
@@ -18,16 +23,22 @@ from phys_sims_utils.harness.plotting import (
     plot_metric_scatter,
     plot_objective_heatmap_2d,
     plot_objective_slice_1d,
+    plot_objective_slices_1d,
 )
 from phys_sims_utils.shared import OptimizationHistory, SweepResult
 
+_ResultT = TypeVar("_ResultT")
+
 
-@dataclass(frozen=True)
 class AgentWorkflowError(Exception):
     """Structured workflow error for invalid requests."""
 
-    code: str
-    message: str
+    __slots__ = ("code", "message")
+
+    def __init__(self, code: str, message: str) -> None:
+        super().__init__(code, message)
+        self.code = code
+        self.message = message
 
     def __str__(self) -> str:
         return f"{self.code}: {self.message}"
@@ -118,12 +129,14 @@ class GraphicsIntent:
         "sweep_summary",
         "optimization_summary",
         "objective_slice_1d",
+        "objective_slices_1d",
         "objective_heatmap_2d",
         "metric_scatter",
         "convergence_plot",
     ]
     x: str | None = None
     y: str | None = None
+    parameters: tuple[str, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -150,17 +163,16 @@ def run_adaptation_assistant(request: AdaptationAssistantRequest) -> AdaptationA
     """Inspect repository scripts and emit deterministic adaptation artifacts."""
     root = Path(request.project_root)
     output_dir = Path(request.output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    findings: list[RepoIssue] = []
-    for script_path in sorted(root.rglob("*.py")):
-        result = check_script_metadata(
-            script_path,
-            valid_parameter_paths=set(request.valid_parameter_paths),
-        )
-        findings.extend(result.issues)
 
-    findings = sorted(findings, key=lambda issue: (issue.code, issue.message))
+    check = partial(
+        check_script_metadata,
+        valid_parameter_paths=frozenset(request.valid_parameter_paths),
+    )
+    # Scripts are checked independently (read + optional parse); map() keeps path order.
+    with ThreadPoolExecutor() as executor:
+        results = list(executor.map(check, sorted(_iter_python_files(root))))
+    findings = [issue for result in results for issue in result.issues]
+    findings.sort(key=attrgetter("code", "message"))
     checklist = _adaptation_checklist(findings)
 
     report_payload = {
@@ -171,7 +183,6 @@ def run_adaptation_assistant(request: AdaptationAssistantRequest) -> AdaptationA
         "checklist": list(checklist),
     }
     report_path = output_dir / "adaptation_report.json"
-    report_path.write_text(json.dumps(report_payload, sort_keys=True, indent=2), encoding="utf-8")
 
     manifest = AgentArtifactManifest(
         workflow="adaptation-assistant",
@@ -186,7 +197,10 @@ def run_adaptation_assistant(request: AdaptationAssistantRequest) -> AdaptationA
             ),
         ),
     )
-    _write_manifest(output_dir / "manifest.json", manifest)
+    _write_json_artifacts(
+        output_dir,
+        {report_path.name: report_payload, "manifest.json": manifest},
+    )
 
     return AdaptationAssistantResponse(
         manifest=manifest,
@@ -238,14 +252,12 @@ def advise_optimization_strategy(
         fallbacks.append("cmaes-unavailable-no-cma")
 
     output_root = Path(output_dir)
-    output_root.mkdir(parents=True, exist_ok=True)
     rec_path = output_root / "strategy_advice.json"
     rec_payload = {
         "recommended": recommendation,
         "rationale": rationale,
         "fallbacks": fallbacks,
     }
-    rec_path.write_text(json.dumps(rec_payload, sort_keys=True, indent=2), encoding="utf-8")
 
     manifest = AgentArtifactManifest(
         workflow="strategy-advisor",
@@ -260,7 +272,7 @@ def advise_optimization_strategy(
             ),
         ),
     )
-    _write_manifest(output_root / "manifest.json", manifest)
+    _write_json_artifacts(output_root, {rec_path.name: rec_payload, "manifest.json": manifest})
 
     return StrategyAdvisorResponse(
         manifest=manifest,
@@ -295,7 +307,7 @@ def run_graphics_concierge(request: GraphicsConciergeRequest) -> GraphicsConcier
         provenance=dict(request.provenance),
         artifacts=tuple(artifacts),
     )
-    _write_manifest(output_dir / "manifest.json", manifest)
+    _write_json_artifacts(output_dir, {"manifest.json": manifest})
     return GraphicsConciergeResponse(manifest=manifest)
 
 
@@ -304,46 +316,10 @@ def _run_sweep_intents(
     intents: tuple[GraphicsIntent, ...],
     output_dir: Path,
 ) -> list[AgentArtifactRecord]:
-    artifacts: list[AgentArtifactRecord] = []
-    for intent in intents:
-        if intent.kind == "sweep_summary":
-            path = save_summary(build_sweep_summary(result), output_dir / "sweep.summary.json")
-            artifacts.append(AgentArtifactRecord("sweep-summary", path.as_posix(), "json"))
-        elif intent.kind == "objective_slice_1d":
-            if intent.x is None:
-                raise AgentWorkflowError("missing-x-parameter", "objective_slice_1d requires x")
-            path = plot_objective_slice_1d(
-                result,
-                parameter=intent.x,
-                output_path=output_dir / f"objective_slice_{intent.x}.png",
-            )
-            artifacts.append(AgentArtifactRecord("objective-slice-1d", path.as_posix(), "png"))
-        elif intent.kind == "objective_heatmap_2d":
-            if intent.x is None or intent.y is None:
-                raise AgentWorkflowError(
-                    "missing-heatmap-axes",
-                    "objective_heatmap_2d requires x and y",
-                )
-            path = plot_objective_heatmap_2d(
-                result,
-                x_parameter=intent.x,
-                y_parameter=intent.y,
-                output_path=output_dir / f"objective_heatmap_{intent.x}_{intent.y}.png",
-            )
-            artifacts.append(AgentArtifactRecord("objective-heatmap-2d", path.as_posix(), "png"))
-        elif intent.kind == "metric_scatter":
-            if intent.x is None or intent.y is None:
-                raise AgentWorkflowError("missing-metrics", "metric_scatter requires x and y")
-            path = plot_metric_scatter(
-                result,
-                x_metric=intent.x,
-                y_metric=intent.y,
-                output_path=output_dir / f"metric_scatter_{intent.x}_{intent.y}.png",
-            )
-            artifacts.append(AgentArtifactRecord("metric-scatter", path.as_posix(), "png"))
-        else:
-            raise AgentWorkflowError("unsupported-intent", intent.kind)
-    return artifacts
+    return [
+        _intent_handler(_SWEEP_INTENT_HANDLERS, intent)(result, intent, output_dir)
+        for intent in intents
+    ]
 
 
 def _run_optimization_intents(
@@ -351,24 +327,144 @@ def _run_optimization_intents(
     intents: tuple[GraphicsIntent, ...],
     output_dir: Path,
 ) -> list[AgentArtifactRecord]:
-    artifacts: list[AgentArtifactRecord] = []
-    for intent in intents:
-        if intent.kind == "optimization_summary":
-            path = save_summary(
-                build_optimization_summary(result),
-                output_dir / "optimization.summary.json",
-            )
-            artifacts.append(AgentArtifactRecord("optimization-summary", path.as_posix(), "json"))
-        elif intent.kind == "convergence_plot":
-            path = plot_convergence_best_so_far(result, output_path=output_dir / "convergence.png")
-            artifacts.append(AgentArtifactRecord("convergence-plot", path.as_posix(), "png"))
-        else:
-            raise AgentWorkflowError("unsupported-intent", intent.kind)
-    return artifacts
+    return [
+        _intent_handler(_OPTIMIZATION_INTENT_HANDLERS, intent)(result, intent, output_dir)
+        for intent in intents
+    ]
+
+
+def _intent_handler(
+    handlers: Mapping[str, Callable[[_ResultT, GraphicsIntent, Path], AgentArtifactRecord]],
+    intent: GraphicsIntent,
+) -> Callable[[_ResultT, GraphicsIntent, Path], AgentArtifactRecord]:
+    handler = handlers.get(intent.kind)
+    if handler is None:
+        raise AgentWorkflowError("unsupported-intent", intent.kind)
+    return handler
+
+
+def _sweep_summary_intent(
+    result: SweepResult, intent: GraphicsIntent, output_dir: Path
+) -> AgentArtifactRecord:
+    path = save_summary(build_sweep_summary(result), output_dir / "sweep.summary.json")
+    return AgentArtifactRecord("sweep-summary", path.as_posix(), "json")
+
+
+def _objective_slice_1d_intent(
+    result: SweepResult, intent: GraphicsIntent, output_dir: Path
+) -> AgentArtifactRecord:
+    if intent.x is None:
+        raise AgentWorkflowError("missing-x-parameter", "objective_slice_1d requires x")
+    path = plot_objective_slice_1d(
+        result,
+        parameter=intent.x,
+        output_path=output_dir / f"objective_slice_{intent.x}.png",
+    )
+    return AgentArtifactRecord("objective-slice-1d", path.as_posix(), "png")
+
+
+def _objective_slices_1d_intent(
+    result: SweepResult, intent: GraphicsIntent, output_dir: Path
+) -> AgentArtifactRecord:
+    if not intent.parameters:
+        raise AgentWorkflowError(
+            "missing-parameters",
+            "objective_slices_1d requires parameters",
+        )
+    # One figure for all requested slices instead of one figure per parameter.
+    path = plot_objective_slices_1d(
+        result,
+        parameters=intent.parameters,
+        output_path=output_dir / f"objective_slices_{'_'.join(intent.parameters)}.png",
+    )
+    return AgentArtifactRecord("objective-slices-1d", path.as_posix(), "png")
+
+
+def _objective_heatmap_2d_intent(
+    result: SweepResult, intent: GraphicsIntent, output_dir: Path
+) -> AgentArtifactRecord:
+    if intent.x is None or intent.y is None:
+        raise AgentWorkflowError(
+            "missing-heatmap-axes",
+            "objective_heatmap_2d requires x and y",
+        )
+    path = plot_objective_heatmap_2d(
+        result,
+        x_parameter=intent.x,
+        y_parameter=intent.y,
+        output_path=output_dir / f"objective_heatmap_{intent.x}_{intent.y}.png",
+    )
+    return AgentArtifactRecord("objective-heatmap-2d", path.as_posix(), "png")
+
+
+def _metric_scatter_intent(
+    result: SweepResult, intent: GraphicsIntent, output_dir: Path
+) -> AgentArtifactRecord:
+    if intent.x is None or intent.y is None:
+        raise AgentWorkflowError("missing-metrics", "metric_scatter requires x and y")
+    path = plot_metric_scatter(
+        result,
+        x_metric=intent.x,
+        y_metric=intent.y,
+        output_path=output_dir / f"metric_scatter_{intent.x}_{intent.y}.png",
+    )
+    return AgentArtifactRecord("metric-scatter", path.as_posix(), "png")
+
+
+def _optimization_summary_intent(
+    result: OptimizationHistory, intent: GraphicsIntent, output_dir: Path
+) -> AgentArtifactRecord:
+    path = save_summary(
+        build_optimization_summary(result),
+        output_dir / "optimization.summary.json",
+    )
+    return AgentArtifactRecord("optimization-summary", path.as_posix(), "json")
+
+
+def _convergence_plot_intent(
+    result: OptimizationHistory, intent: GraphicsIntent, output_dir: Path
+) -> AgentArtifactRecord:
+    path = plot_convergence_best_so_far(result, output_path=output_dir / "convergence.png")
+    return AgentArtifactRecord("convergence-plot", path.as_posix(), "png")
+
+
+_SWEEP_INTENT_HANDLERS: dict[
+    str, Callable[[SweepResult, GraphicsIntent, Path], AgentArtifactRecord]
+] = {
+    "sweep_summary": _sweep_summary_intent,
+    "objective_slice_1d": _objective_slice_1d_intent,
+    "objective_slices_1d": _objective_slices_1d_intent,
+    "objective_heatmap_2d": _objective_heatmap_2d_intent,
+    "metric_scatter": _metric_scatter_intent,
+}
+_OPTIMIZATION_INTENT_HANDLERS: dict[
+    str, Callable[[OptimizationHistory, GraphicsIntent, Path], AgentArtifactRecord]
+] = {
+    "optimization_summary": _optimization_summary_intent,
+    "convergence_plot": _convergence_plot_intent,
+}
+
+
+def _iter_python_files(root: Path) -> Iterator[Path]:
+    """Yield ``*.py`` files under ``root`` using cached ``DirEntry`` type checks."""
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_python_files(Path(entry.path))
+                elif entry.name.endswith(".py") and entry.is_file():
+                    yield Path(entry.path)
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return
 
 
 def _adaptation_checklist(findings: list[RepoIssue]) -> tuple[str, ...]:
-    by_code = {issue.code for issue in findings}
+    return _checklist_for_codes(frozenset(issue.code for issue in findings))
+
+
+@lru_cache(maxsize=64)
+def _checklist_for_codes(by_code: frozenset[str]) -> tuple[str, ...]:
+    # The finding-code universe is small, so identical code sets share one cached tuple.
     checklist: list[str] = []
     if "missing-seed-policy" in by_code or "missing-seed-argument" in by_code:
         checklist.append(
@@ -386,8 +482,24 @@ def _adaptation_checklist(findings: list[RepoIssue]) -> tuple[str, ...]:
     return tuple(checklist)
 
 
-def _write_manifest(path: Path, manifest: AgentArtifactManifest) -> None:
-    path.write_text(json.dumps(manifest.to_dict(), sort_keys=True, indent=2), encoding="utf-8")
+def _write_json_artifacts(output_dir: Path, payloads: Mapping[str, object]) -> None:
+    """Write a workflow's JSON artifacts after a single directory creation."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for name, payload in payloads.items():
+        # Dataclass trees (manifests) are encoded directly; field names match ``to_dict`` keys.
+        (output_dir / name).write_bytes(_encode_artifact_json(payload).encode("utf-8"))
+
+
+def _dataclass_fields(value: object) -> dict[str, Any]:
+    if is_dataclass(value) and not isinstance(value, type):
+        return vars(value)
+    msg = f"Object of type {type(value).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+_encode_artifact_json = json.JSONEncoder(
+    sort_keys=True, indent=2, default=_dataclass_fields
+).encode
 
 
 __all__ = [
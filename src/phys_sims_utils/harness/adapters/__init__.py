@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any, Protocol
 
 from phys_sims_utils.shared import EvalResult
@@ -14,4 +15,13 @@ class Adapter(Protocol):
         """Run one deterministic evaluation for a config/seed pair."""
 
 
-__all__ = ["Adapter"]
+class BatchAdapter(Adapter, Protocol):
+    """Adapter that can also evaluate many config/seed pairs in one call."""
+
+    def run_batch(
+        self, configs: Sequence[dict[str, Any]], seeds: Sequence[int]
+    ) -> Sequence[EvalResult]:
+        """Run evaluations for aligned configs/seeds, returning results in input order."""
+
+
+__all__ = ["Adapter", "BatchAdapter"]
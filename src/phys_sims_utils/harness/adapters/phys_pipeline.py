@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import inspect
-from collections.abc import Callable, Mapping
+import operator
+from collections.abc import Callable, Mapping, Sequence
+from functools import lru_cache
 from importlib import import_module
 from typing import Any, Protocol, cast
 
@@ -15,28 +17,104 @@ class _PipelineProtocol(Protocol):
         """Execute one simulation evaluation."""
 
 
+_NUMERIC_TYPES = frozenset({int, float})
+
 MetricExtractor = Callable[[Mapping[str, Any]], float]
 PipelineFactory = Callable[..., _PipelineProtocol]
+_PipelineCall = Callable[[Mapping[str, Any], int], Any]
 
 
 class PhysPipelineAdapter:
-    """Thin adapter that converts pipeline outputs into canonical ``EvalResult`` records."""
+    """Thin adapter that converts pipeline outputs into canonical ``EvalResult`` records.
+
+    With ``cache_pipelines=True``, pipelines built by a factory (or the default
+    ``phys-pipeline`` entrypoint) are kept per seed and reused when that seed repeats.
+    At most ``pipeline_cache_size`` pipelines are kept, in least-recently-used order.
+    Only enable it for factories without per-call side effects.
+    """
 
     def __init__(
         self,
         pipeline: _PipelineProtocol | PipelineFactory | None = None,
         *,
         objective_key: str,
-        metric_extractors: Mapping[str, MetricExtractor] | None = None,
+        metric_extractors: Mapping[str, MetricExtractor | str] | None = None,
+        cache_pipelines: bool = False,
+        pipeline_cache_size: int = 64,
     ) -> None:
+        if cache_pipelines and pipeline_cache_size <= 0:
+            msg = "pipeline_cache_size must be > 0"
+            raise ValueError(msg)
         self._pipeline_or_factory = pipeline
+        self._pipeline_cache_size = pipeline_cache_size
+        self._pipeline_cache: dict[int, _PipelineProtocol] | None = {} if cache_pipelines else None
         self._objective_key = objective_key
-        self._metric_extractors = dict(metric_extractors or {})
+        # String extractors name an output key; compile them to itemgetters once.
+        self._metric_extractors: tuple[tuple[str, MetricExtractor], ...] = tuple(
+            (name, operator.itemgetter(extractor) if isinstance(extractor, str) else extractor)
+            for name, extractor in (metric_extractors or {}).items()
+        )
+        # Bound call for a fixed pipeline instance, resolved on first use.
+        self._invoke: _PipelineCall | None = None
 
     def run(self, config: dict[str, Any], seed: int) -> EvalResult:
-        pipeline = self._resolve_pipeline(seed=seed)
-        raw_output = self._run_pipeline(pipeline=pipeline, config=config, seed=seed)
+        invoke = self._invoke or self._resolve_invoke(seed=seed)
+        raw_output = invoke(config, seed)
+        if not isinstance(raw_output, Mapping):
+            msg = (
+                "Pipeline methods must return a mapping of objective/metrics, "
+                f"got {type(raw_output).__name__}."
+            )
+            raise TypeError(msg)
+        return self._to_eval_result(raw_output, config=config, seed=seed)
+
+    def run_batch(
+        self, configs: Sequence[dict[str, Any]], seeds: Sequence[int]
+    ) -> list[EvalResult]:
+        """Run aligned config/seed pairs, delegating to ``pipeline.run_batch`` when present.
 
+        Batch delegation only applies to pipeline instances; factories and the default
+        ``phys-pipeline`` entrypoint are resolved per seed and evaluated one by one.
+        """
+        if len(configs) != len(seeds):
+            msg = f"run_batch requires one seed per config, got {len(configs)} and {len(seeds)}"
+            raise ValueError(msg)
+
+        candidate = self._pipeline_or_factory
+        batch_method = (
+            getattr(candidate, "run_batch", None)
+            if candidate is not None and _is_pipeline_instance(candidate)
+            else None
+        )
+        if batch_method is None:
+            return [
+                self.run(config=config, seed=seed)
+                for config, seed in zip(configs, seeds, strict=True)
+            ]
+
+        raw_outputs = batch_method(configs, seeds)
+        if not isinstance(raw_outputs, Sequence) or len(raw_outputs) != len(configs):
+            msg = "Pipeline run_batch must return one mapping per config, in input order."
+            raise TypeError(msg)
+
+        results: list[EvalResult] = []
+        for raw_output, config, seed in zip(raw_outputs, configs, seeds, strict=True):
+            if not isinstance(raw_output, Mapping):
+                msg = (
+                    "Pipeline run_batch must return mappings of objective/metrics, "
+                    f"got {type(raw_output).__name__}."
+                )
+                raise TypeError(msg)
+            results.append(self._to_eval_result(raw_output, config=config, seed=seed))
+        return results
+
+    def _to_eval_result(
+        self,
+        raw_output: Mapping[str, Any],
+        *,
+        config: Mapping[str, Any],
+        seed: int,
+    ) -> EvalResult:
         if self._objective_key not in raw_output:
             msg = (
                 f"Pipeline output is missing objective key '{self._objective_key}'. "
@@ -46,7 +124,7 @@ class PhysPipelineAdapter:
 
         metrics = {
             metric_name: float(extractor(raw_output))
-            for metric_name, extractor in self._metric_extractors.items()
+            for metric_name, extractor in self._metric_extractors
         }
 
         return EvalResult(
@@ -57,12 +135,25 @@ class PhysPipelineAdapter:
         )
 
     def _resolve_pipeline(self, seed: int) -> _PipelineProtocol:
-        if self._pipeline_or_factory is None:
-            return _default_pipeline(seed=seed)
-
         candidate = self._pipeline_or_factory
-        if _is_pipeline_instance(candidate):
+        if candidate is not None and _is_pipeline_instance(candidate):
             return cast(_PipelineProtocol, candidate)
+        if self._pipeline_cache is None:
+            return self._build_pipeline(seed)
+
+        cache = self._pipeline_cache
+        pipeline = cache.pop(seed, None)
+        if pipeline is None:
+            pipeline = self._build_pipeline(seed)
+            if len(cache) >= self._pipeline_cache_size:
+                del cache[next(iter(cache))]
+        cache[seed] = pipeline  # (re-)insert as most recently used
+        return pipeline
+
+    def _build_pipeline(self, seed: int) -> _PipelineProtocol:
+        candidate = self._pipeline_or_factory
+        if candidate is None:
+            return _default_pipeline(seed=seed)
 
         pipeline = _call_with_optional_seed(cast(PipelineFactory, candidate), seed)
         if not _is_pipeline_instance(pipeline):
@@ -72,29 +163,43 @@ class PhysPipelineAdapter:
             raise TypeError(msg)
         return cast(_PipelineProtocol, pipeline)
 
-    def _run_pipeline(
-        self,
-        *,
-        pipeline: _PipelineProtocol,
-        config: Mapping[str, Any],
-        seed: int,
-    ) -> Mapping[str, Any]:
-        for method_name in ("run", "evaluate"):
-            method = getattr(pipeline, method_name, None)
-            if method is None:
-                continue
-            output = _call_with_config_and_seed(method, config=config, seed=seed)
-            if not isinstance(output, Mapping):
-                msg = (
-                    "Pipeline methods must return a mapping of objective/metrics, "
-                    f"got {type(output).__name__}."
-                )
-                raise TypeError(msg)
-            return output
-
-        msg = "Pipeline object must expose a 'run' or 'evaluate' method."
+    def _resolve_invoke(self, seed: int) -> _PipelineCall:
+        invoke = _bind_pipeline_call(self._resolve_pipeline(seed=seed))
+        candidate = self._pipeline_or_factory
+        if candidate is not None and _is_pipeline_instance(candidate):
+            # A fixed instance always resolves to the same method and calling convention.
+            self._invoke = invoke
+        return invoke
+
+
+def _bind_pipeline_call(pipeline: _PipelineProtocol) -> _PipelineCall:
+    """Resolve the pipeline entry method and calling convention once."""
+    for method_name in ("run", "evaluate"):
+        method = getattr(pipeline, method_name, None)
+        if method is None:
+            continue
+        if _supports_kwargs(method, ("config", "seed")):
+            return _KeywordCall(method)
+        if _supports_positional(method, 2):
+            return cast(_PipelineCall, method)
+        msg = "Pipeline method must accept config and seed parameters."
         raise TypeError(msg)
 
+    msg = "Pipeline object must expose a 'run' or 'evaluate' method."
+    raise TypeError(msg)
+
+
+class _KeywordCall:
+    """Forward ``(config, seed)`` as keywords; a module-level class so adapters stay picklable."""
+
+    __slots__ = ("method",)
+
+    def __init__(self, method: Callable[..., Any]) -> None:
+        self.method = method
+
+    def __call__(self, config: Mapping[str, Any], seed: int) -> Any:
+        return self.method(config=config, seed=seed)
+
 
 def _is_pipeline_instance(value: object) -> bool:
     return hasattr(value, "run") or hasattr(value, "evaluate")
@@ -128,10 +233,13 @@ def _import_phys_pipeline() -> Any:
 
 
 def _numeric_theta(config: Mapping[str, Any]) -> dict[str, float]:
+    # Exact int/float (the common case) short-circuits; subclasses such as numpy floats
+    # still qualify through isinstance, while bool is excluded.
     return {
         key: float(value)
         for key, value in config.items()
-        if isinstance(value, (int, float)) and not isinstance(value, bool)
+        if type(value) in _NUMERIC_TYPES
+        or (type(value) is not bool and isinstance(value, (int, float)))
     }
 
 
@@ -143,21 +251,43 @@ def _call_with_optional_seed(function: Callable[..., Any], seed: int) -> Any:
     return function()
 
 
-def _call_with_config_and_seed(
-    function: Callable[..., Any], *, config: Mapping[str, Any], seed: int
-) -> Any:
-    if _supports_kwargs(function, ("config", "seed")):
-        return function(config=config, seed=seed)
-    if _supports_positional(function, 2):
-        return function(config, seed)
-    msg = "Pipeline method must accept config and seed parameters."
-    raise TypeError(msg)
+def _signature(function: Callable[..., Any]) -> inspect.Signature | None:
+    """Return the call signature of ``function`` or ``None`` when it cannot be introspected."""
+    # Bound methods are cached through their underlying function so the cache does not keep
+    # pipeline instances alive; the bound receiver is then dropped like inspect.signature does.
+    target = getattr(function, "__func__", function)
+    try:
+        signature = _cached_signature(target)
+    except TypeError:
+        signature = _uncached_signature(target)
+    if signature is None or target is function:
+        return signature
+
+    parameters = tuple(signature.parameters.values())
+    if not parameters:
+        return None
+    first_kind = parameters[0].kind
+    if first_kind is inspect.Parameter.VAR_POSITIONAL:
+        return signature
+    if first_kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD):
+        return signature.replace(parameters=parameters[1:])
+    return None
+
+
+def _uncached_signature(function: Callable[..., Any]) -> inspect.Signature | None:
+    try:
+        return inspect.signature(function)
+    except (TypeError, ValueError):
+        return None
+
+
+# Unhashable callables raise TypeError at lookup and fall back to ``_uncached_signature``.
+_cached_signature = lru_cache(maxsize=256)(_uncached_signature)
 
 
 def _supports_kwargs(function: Callable[..., Any], keys: tuple[str, ...]) -> bool:
-    try:
-        signature = inspect.signature(function)
-    except (TypeError, ValueError):
+    signature = _signature(function)
+    if signature is None:
         return False
 
     parameters = signature.parameters
@@ -173,9 +303,8 @@ def _supports_kwargs(function: Callable[..., Any], keys: tuple[str, ...]) -> boo
 
 
 def _supports_positional(function: Callable[..., Any], expected_count: int) -> bool:
-    try:
-        signature = inspect.signature(function)
-    except (TypeError, ValueError):
+    signature = _signature(function)
+    if signature is None:
         return True
 
     params = list(signature.parameters.values())
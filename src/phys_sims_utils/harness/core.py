@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import hashlib
 import json
+from collections.abc import Sequence
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from typing import Any, Protocol
 
 from phys_sims_utils.harness.adapters import Adapter
 from phys_sims_utils.harness.metrics import (
     MetricSpec,
-    aggregate_metrics,
+    aggregate_metric_values,
     compute_metrics,
 )
 from phys_sims_utils.harness.sweep import SweepSpec
@@ -45,10 +47,16 @@ class TestHarness(Protocol):
 
 @dataclass
 class InMemoryTestHarness:
-    """Minimal deterministic harness implementation for tests and examples."""
+    """Minimal deterministic harness implementation for tests and examples.
+
+    When ``executor`` is set, adapter evaluations are dispatched through it and
+    collected in submission order, so results match a serial run. Otherwise
+    adapters exposing ``run_batch`` receive the whole sweep in one call.
+    """
 
     name: str = "default"
     allow_unseeded: bool = False
+    executor: Executor | None = None
     _results: list[EvalResult] = field(default_factory=list)
 
     def run_sweep(
@@ -63,41 +71,43 @@ class InMemoryTestHarness:
         points = sweep_spec.sample(seed=run_seed)
         base_hash = _hash_payload(base_config)
 
-        evaluations: list[EvalResult] = []
-        for index, point in enumerate(points):
-            config = dict(base_config)
-            config.update(point)
-            eval_seed = _derive_seed(run_seed, index)
-            result = adapter.run(config=config, seed=eval_seed)
-
-            metrics = dict(result.metrics)
-            metrics.update(compute_metrics(result, metric_spec))
-
-            provenance = dict(result.provenance)
-            provenance.update(
-                {
-                    "harness": self.name,
-                    "sampling_mode": sweep_spec.mode,
-                    "sweep_index": str(index),
-                }
-            )
+        # Copy the base once; ``base | point`` then builds each merged config in one C call.
+        base = dict(base_config)
+        configs: list[dict[str, Any]] = [base | point for point in points]
+        seeds = [_derive_seed(run_seed, index) for index in range(len(points))]
+        results = _run_adapter(adapter, configs, seeds, executor=self.executor)
 
+        evaluations: list[EvalResult] = []
+        computed_metrics: list[dict[str, float]] = []
+        for index, (point, eval_seed, result) in enumerate(
+            zip(points, seeds, results, strict=True)
+        ):
+            computed = compute_metrics(result, metric_spec)
+            computed_metrics.append(computed)
+            # Merged metrics/provenance are single dict displays; theta and artifacts are still
+            # copied because candidate points and adapter results may be caller-owned.
             evaluations.append(
                 EvalResult(
                     theta=dict(point),
                     objective=float(result.objective),
-                    metrics=metrics,
+                    metrics={**result.metrics, **computed},
                     artifacts=dict(result.artifacts),
                     seed=eval_seed,
                     config_hash=base_hash,
                     timestamp=result.timestamp,
-                    provenance=provenance,
+                    provenance={
+                        **result.provenance,
+                        "harness": self.name,
+                        "sampling_mode": sweep_spec.mode,
+                        "sweep_index": str(index),
+                    },
                 )
             )
 
         self._results = evaluations
         evaluation_tuple = tuple(evaluations)
-        aggregate = aggregate_metrics(evaluation_tuple, metric_spec)
+        # Metrics were computed once in the loop above; aggregate those values directly.
+        aggregate = aggregate_metric_values(computed_metrics, metric_spec)
         parameter_space = tuple(sorted(sweep_spec.parameters.keys()))
         sweep_provenance = {
             "harness": self.name,
@@ -121,6 +131,35 @@ def _resolve_seed(seed: int | None, *, allow_unseeded: bool) -> int:
     return int(seed or 0)
 
 
+def _run_adapter(
+    adapter: Adapter,
+    configs: Sequence[dict[str, Any]],
+    seeds: Sequence[int],
+    *,
+    executor: Executor | None,
+) -> list[EvalResult]:
+    if executor is not None:
+        # ``Executor.map`` yields in submission order regardless of completion order.
+        # The bound method is mapped directly so process pools can pickle it.
+        return list(executor.map(adapter.run, configs, seeds))
+
+    run_batch = getattr(adapter, "run_batch", None)
+    if run_batch is not None:
+        results = list(run_batch(configs, seeds))
+        if len(results) != len(configs):
+            msg = (
+                "Adapter run_batch returned "
+                f"{len(results)} results for {len(configs)} configs"
+            )
+            raise ValueError(msg)
+        return results
+
+    return [
+        adapter.run(config=config, seed=seed)
+        for config, seed in zip(configs, seeds, strict=True)
+    ]
+
+
 def _hash_payload(payload: dict[str, Any]) -> str:
     encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
     return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
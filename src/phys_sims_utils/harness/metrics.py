@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass, field
 from statistics import mean
 
@@ -38,10 +38,18 @@ def aggregate_metrics(
     evaluations: tuple[EvalResult, ...], specs: tuple[MetricSpec, ...]
 ) -> dict[str, float]:
     """Aggregate metric values across evaluations in stable order."""
+    return aggregate_metric_values(
+        (compute_metrics(evaluation, specs) for evaluation in evaluations), specs
+    )
+
+
+def aggregate_metric_values(
+    computed: Iterable[Mapping[str, float]], specs: tuple[MetricSpec, ...]
+) -> dict[str, float]:
+    """Aggregate already-computed per-evaluation metrics without recomputing them."""
     by_name: dict[str, list[float]] = {spec.name: [] for spec in specs}
 
-    for evaluation in evaluations:
-        values = compute_metrics(evaluation, specs)
+    for values in computed:
         for spec in specs:
             if spec.name in values:
                 by_name[spec.name].append(values[spec.name])
@@ -56,16 +64,21 @@ def aggregate_metrics(
     return aggregates
 
 
+# Built once at import instead of per aggregate call. "mean" stays on statistics.mean: its
+# exactly rounded result is part of persisted sweep summaries (ADR 0003).
+_AGGREGATORS: dict[str, AggregatorFn] = {
+    "mean": lambda values: float(mean(values)),
+    "min": lambda values: float(min(values)),
+    "max": lambda values: float(max(values)),
+}
+
+
 def _resolve_aggregator(name: str) -> AggregatorFn:
-    normalized = name.lower()
-    if normalized == "mean":
-        return lambda values: float(mean(values))
-    if normalized == "min":
-        return lambda values: float(min(values))
-    if normalized == "max":
-        return lambda values: float(max(values))
-    msg = f"unsupported metric aggregator: {name}"
-    raise ValueError(msg)
+    reducer = _AGGREGATORS.get(name.lower())
+    if reducer is None:
+        msg = f"unsupported metric aggregator: {name}"
+        raise ValueError(msg)
+    return reducer
 
 
 @dataclass(frozen=True)
@@ -75,4 +88,10 @@ class MetricSummary:
     values: Mapping[str, float] = field(default_factory=dict)
 
 
-__all__ = ["MetricSpec", "MetricSummary", "aggregate_metrics", "compute_metrics"]
+__all__ = [
+    "MetricSpec",
+    "MetricSummary",
+    "aggregate_metric_values",
+    "aggregate_metrics",
+    "compute_metrics",
+]
@@ -6,6 +6,7 @@ from phys_sims_utils.harness.plotting.sweep_plots import (
     plot_metric_scatter,
     plot_objective_heatmap_2d,
     plot_objective_slice_1d,
+    plot_objective_slices_1d,
 )
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     "plot_metric_scatter",
     "plot_objective_heatmap_2d",
     "plot_objective_slice_1d",
+    "plot_objective_slices_1d",
 ]
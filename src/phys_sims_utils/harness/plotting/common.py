@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from importlib import import_module
 from pathlib import Path
 from typing import Any
 
 
+@lru_cache(maxsize=1)
 def require_matplotlib() -> Any:
-    """Import and return ``matplotlib.pyplot`` or raise a clear error."""
+    """Import and return ``matplotlib.pyplot`` or raise a clear error.
+
+    The module is resolved once; a failed import is not cached and is retried.
+    """
     try:
         return import_module("matplotlib.pyplot")
     except ImportError as exc:  # pragma: no cover - optional dependency path
@@ -16,6 +21,15 @@ def require_matplotlib() -> Any:
         raise RuntimeError(msg) from exc
 
 
+@lru_cache(maxsize=1)
+def _figure_class() -> Any:
+    try:
+        return import_module("matplotlib.figure").Figure
+    except ImportError as exc:  # pragma: no cover - optional dependency path
+        msg = "plotting helpers require matplotlib"
+        raise RuntimeError(msg) from exc
+
+
 def make_output_path(path: str | Path, *, default_suffix: str = ".png") -> Path:
     """Create parent directories and ensure output path has a file suffix."""
     output = Path(path)
@@ -25,10 +39,19 @@ def make_output_path(path: str | Path, *, default_suffix: str = ".png") -> Path:
     return output
 
 
-def create_figure(*, figsize: tuple[float, float] = (7.0, 4.5)) -> tuple[Any, Any]:
-    """Create a canonical figure and axes with a deterministic style."""
-    plt = require_matplotlib()
-    fig, ax = plt.subplots(figsize=figsize, constrained_layout=True)
+def create_figure(
+    *,
+    figsize: tuple[float, float] = (7.0, 4.5),
+    ncols: int = 1,
+) -> tuple[Any, Any]:
+    """Create a canonical figure and axes with a deterministic style.
+
+    With ``ncols > 1`` the second item is an array of side-by-side axes.
+    """
+    # Built without pyplot: no GUI backend is initialised and nothing is registered in
+    # pyplot's global figure list. savefig renders raster formats with Agg regardless.
+    fig = _figure_class()(figsize=figsize, layout="constrained")
+    ax = fig.subplots(ncols=ncols)
     return fig, ax
 
 
@@ -43,9 +66,9 @@ def finalize_figure(
     destination = make_output_path(output_path)
     fig.savefig(destination, dpi=dpi)
 
-    if close:
-        plt = require_matplotlib()
-        plt.close(fig)
+    # Only pyplot-managed figures (ones a caller created with plt) need closing there.
+    if close and getattr(fig.canvas, "manager", None) is not None:
+        require_matplotlib().close(fig)
 
     return destination
 
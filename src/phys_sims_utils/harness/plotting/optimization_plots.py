@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from itertools import accumulate
 from pathlib import Path
 
 from phys_sims_utils.harness.plotting.common import create_figure, finalize_figure
@@ -19,13 +20,11 @@ def plot_convergence_best_so_far(
         msg = "optimization history must include at least one evaluation"
         raise ValueError(msg)
 
-    best_values: list[float] = []
-    current_best = float("inf")
-    for evaluation in history.evaluations:
-        current_best = min(current_best, float(evaluation.objective))
-        best_values.append(current_best)
-
-    eval_counts = list(range(1, len(best_values) + 1))
+    # Prefix minimum in one C-level pass over the objectives.
+    best_values = list(
+        accumulate((float(evaluation.objective) for evaluation in history.evaluations), min)
+    )
+    eval_counts = range(1, len(best_values) + 1)
 
     fig, ax = create_figure()
     ax.plot(eval_counts, best_values, marker="o", linewidth=1.5)
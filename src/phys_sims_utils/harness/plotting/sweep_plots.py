@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from pathlib import Path
+from typing import Any
 
 from phys_sims_utils.harness.plotting.common import (
     create_figure,
     finalize_figure,
-    require_matplotlib,
 )
 from phys_sims_utils.shared import SweepResult
 
@@ -20,6 +21,38 @@ def plot_objective_slice_1d(
     dpi: int = 150,
 ) -> Path:
     """Plot objective values against a single parameter from sweep evaluations."""
+    points = _slice_points(sweep, parameter)
+
+    fig, ax = create_figure()
+    _draw_objective_slice(ax, points, parameter)
+
+    return finalize_figure(fig, output_path, dpi=dpi)
+
+
+def plot_objective_slices_1d(
+    sweep: SweepResult,
+    *,
+    parameters: Sequence[str],
+    output_path: str | Path,
+    dpi: int = 150,
+) -> Path:
+    """Plot one objective slice per parameter side by side in a single figure."""
+    if not parameters:
+        msg = "parameters must name at least one sweep parameter"
+        raise ValueError(msg)
+    # Validate every parameter before paying for figure setup.
+    points = [_slice_points(sweep, parameter) for parameter in parameters]
+
+    fig, axes = create_figure(figsize=(4.0 * len(parameters), 4.0), ncols=len(parameters))
+    for ax, parameter_points, parameter in zip(
+        axes if len(parameters) > 1 else (axes,), points, parameters, strict=True
+    ):
+        _draw_objective_slice(ax, parameter_points, parameter)
+
+    return finalize_figure(fig, output_path, dpi=dpi)
+
+
+def _slice_points(sweep: SweepResult, parameter: str) -> list[tuple[float, float]]:
     points = sorted(
         (
             evaluation.theta[parameter],
@@ -31,19 +64,16 @@ def plot_objective_slice_1d(
     if not points:
         msg = f"parameter '{parameter}' not found in sweep evaluations"
         raise ValueError(msg)
+    return [(float(value), float(objective)) for value, objective in points]
 
-    x_values = [float(value) for value, _ in points]
-    y_values = [float(value) for _, value in points]
 
-    fig, ax = create_figure()
-    ax.plot(x_values, y_values, marker="o", linewidth=1.5)
+def _draw_objective_slice(ax: Any, points: list[tuple[float, float]], parameter: str) -> None:
+    ax.plot([x for x, _ in points], [y for _, y in points], marker="o", linewidth=1.5)
     ax.set_xlabel(parameter)
     ax.set_ylabel("objective")
     ax.set_title(f"Objective slice: {parameter}")
     ax.grid(alpha=0.3)
 
-    return finalize_figure(fig, output_path, dpi=dpi)
-
 
 def plot_objective_heatmap_2d(
     sweep: SweepResult,
@@ -70,7 +100,6 @@ def plot_objective_heatmap_2d(
         )
         raise ValueError(msg)
 
-    plt = require_matplotlib()
     fig, ax = create_figure(figsize=(6.5, 5.2))
     x_values = [row[0] for row in triples]
     y_values = [row[1] for row in triples]
@@ -84,7 +113,6 @@ def plot_objective_heatmap_2d(
     colorbar = fig.colorbar(mesh, ax=ax)
     colorbar.set_label("objective")
     ax.grid(alpha=0.2)
-    plt.tight_layout()
 
     return finalize_figure(fig, output_path, dpi=dpi)
 
@@ -139,4 +167,5 @@ __all__ = [
     "plot_metric_scatter",
     "plot_objective_heatmap_2d",
     "plot_objective_slice_1d",
+    "plot_objective_slices_1d",
 ]
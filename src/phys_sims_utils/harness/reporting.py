@@ -3,24 +3,20 @@
 from __future__ import annotations
 
 import json
+from collections import defaultdict
 from pathlib import Path
 from typing import Any
 
-from phys_sims_utils.shared import OptimizationHistory, SweepResult
+from phys_sims_utils.shared import EvalResult, OptimizationHistory, SweepResult
+
+# Same options as json.dumps(sort_keys=True, indent=2), built once instead of per call.
+_encode_json = json.JSONEncoder(sort_keys=True, indent=2).encode
 
 
 def build_sweep_summary(result: SweepResult) -> dict[str, Any]:
     """Build a stable summary artifact for a sweep run."""
-    objectives = [evaluation.objective for evaluation in result.evaluations]
-    metric_keys = sorted(
-        {
-            key
-            for evaluation in result.evaluations
-            for key in evaluation.metrics
-        }
-    )
-    structure_values = _collect_structure_values(
-        [evaluation.theta for evaluation in result.evaluations]
+    objective, metric_keys, structure_values = _scan_evaluations(
+        result.evaluations, collect_metric_keys=True
     )
 
     return {
@@ -30,12 +26,8 @@ def build_sweep_summary(result: SweepResult) -> dict[str, Any]:
         "parameter_space": list(result.parameter_space),
         "config_hash": result.config_hash,
         "provenance": dict(result.provenance),
-        "objective": {
-            "min": min(objectives) if objectives else None,
-            "max": max(objectives) if objectives else None,
-            "mean": (sum(objectives) / len(objectives)) if objectives else None,
-        },
-        "metrics_present": metric_keys,
+        "objective": objective,
+        "metrics_present": sorted(metric_keys),
         "structure_keys": sorted(structure_values),
         "structure_values": structure_values,
     }
@@ -43,11 +35,10 @@ def build_sweep_summary(result: SweepResult) -> dict[str, Any]:
 
 def build_optimization_summary(history: OptimizationHistory) -> dict[str, Any]:
     """Build a stable summary artifact for an optimization run."""
-    objectives = [evaluation.objective for evaluation in history.evaluations]
-    best = history.best
-    structure_values = _collect_structure_values(
-        [evaluation.theta for evaluation in history.evaluations]
+    objective, _metric_keys, structure_values = _scan_evaluations(
+        history.evaluations, collect_metric_keys=False
     )
+    best = history.best
 
     return {
         "run_type": "optimization",
@@ -56,35 +47,57 @@ def build_optimization_summary(history: OptimizationHistory) -> dict[str, Any]:
         "parameter_space": list(history.parameter_space),
         "config_hash": history.config_hash,
         "provenance": dict(history.provenance),
-        "objective": {
-            "min": min(objectives) if objectives else None,
-            "max": max(objectives) if objectives else None,
-            "mean": (sum(objectives) / len(objectives)) if objectives else None,
-        },
+        "objective": objective,
         "best": best.to_dict() if best is not None else None,
         "structure_keys": sorted(structure_values),
         "structure_values": structure_values,
     }
 
 
-def _collect_structure_values(thetas: list[dict[str, Any]]) -> dict[str, list[Any]]:
-    grouped: dict[str, set[Any]] = {}
-    for theta in thetas:
-        for key, value in theta.items():
-            if isinstance(value, float):
+def _scan_evaluations(
+    evaluations: tuple[EvalResult, ...], *, collect_metric_keys: bool
+) -> tuple[dict[str, Any], set[str], dict[str, list[Any]]]:
+    """Collect objective stats, structure values, and optionally metric keys in one pass."""
+    if not evaluations:
+        return {"min": None, "max": None, "mean": None}, set(), {}
+
+    lowest = highest = evaluations[0].objective
+    total: float = 0
+    metric_keys: set[str] = set()
+    grouped: defaultdict[str, set[Any]] = defaultdict(set)
+    for evaluation in evaluations:
+        value = evaluation.objective
+        # Same comparisons as min()/max() so ties and NaN resolve identically.
+        if value < lowest:
+            lowest = value
+        if value > highest:
+            highest = value
+        total += value
+        if collect_metric_keys:
+            metric_keys.update(evaluation.metrics)
+        for key, item in evaluation.theta.items():
+            if isinstance(item, float):
                 continue
-            grouped.setdefault(key, set()).add(value)
-    return {key: sorted(values, key=str) for key, values in sorted(grouped.items())}
+            grouped[key].add(item)
+
+    objective = {"min": lowest, "max": highest, "mean": total / len(evaluations)}
+    structure_values = {key: sorted(values, key=str) for key, values in sorted(grouped.items())}
+    return objective, metric_keys, structure_values
 
 
 def save_summary(summary: dict[str, Any], path: str | Path) -> Path:
     """Persist a summary artifact as deterministic JSON."""
     destination = Path(path)
     destination.parent.mkdir(parents=True, exist_ok=True)
-    destination.write_text(json.dumps(summary, sort_keys=True, indent=2), encoding="utf-8")
+    destination.write_bytes(_dump_json_bytes(summary))
     return destination
 
 
+def _dump_json_bytes(payload: dict[str, Any]) -> bytes:
+    # Single encoding point for JSON artifacts; output bytes are part of the determinism contract.
+    return _encode_json(payload).encode("utf-8")
+
+
 __all__ = [
     "build_optimization_summary",
     "build_sweep_summary",
@@ -44,10 +44,7 @@ def _sample_grid(parameters: Mapping[str, Sequence[float]]) -> tuple[SamplePoint
     names = _stable_parameter_names(parameters)
     values = [tuple(float(v) for v in parameters[name]) for name in names]
 
-    points: list[SamplePoint] = []
-    for row in product(*values):
-        points.append({name: value for name, value in zip(names, row, strict=True)})
-    return tuple(points)
+    return tuple(dict(zip(names, row, strict=True)) for row in product(*values))
 
 
 def _bounds(values: Sequence[float]) -> tuple[float, float]:
@@ -78,15 +75,11 @@ def _sample_random(
     names = _stable_parameter_names(parameters)
     ranges = [_bounds(parameters[name]) for name in names]
     n = _resolve_num_samples(num_samples)
-    rng = random.Random(seed)
+    draw = random.Random(seed).random
+    # Same arithmetic as Random.uniform (low + (high - low) * random()), with spans hoisted.
+    axes = [(name, low, high - low) for name, (low, high) in zip(names, ranges, strict=True)]
 
-    points: list[SamplePoint] = []
-    for _ in range(n):
-        point: SamplePoint = {}
-        for name, (low, high) in zip(names, ranges, strict=True):
-            point[name] = rng.uniform(low, high)
-        points.append(point)
-    return tuple(points)
+    return tuple({name: low + span * draw() for name, low, span in axes} for _ in range(n))
 
 
 def _sample_sobol(
@@ -105,14 +98,11 @@ def _sample_sobol(
     sampler = qmc.Sobol(d=len(names), scramble=True, seed=seed)
     unit_samples = sampler.random(n=n)
 
-    points: list[SamplePoint] = []
-    for row in unit_samples:
-        point: SamplePoint = {}
-        for index, name in enumerate(names):
-            low, high = ranges[index]
-            point[name] = low + float(row[index]) * (high - low)
-        points.append(point)
-    return tuple(points)
+    # Rescale the whole (n, d) array in one broadcast, then convert to floats in one call.
+    lows = [low for low, _ in ranges]
+    spans = [high - low for low, high in ranges]
+    scaled = (lows + unit_samples * spans).tolist()
+    return tuple(dict(zip(names, row, strict=True)) for row in scaled)
 
 
 __all__ = ["SamplingMode", "SweepSpec"]
@@ -2,22 +2,98 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from typing import Any
 
 from phys_sims_utils.harness.adapters import Adapter
 from phys_sims_utils.shared import EvalResult
 
+# Memo keys are process-local (unlike persisted config hashes), so blake2b suffices.
+_encode_key = json.JSONEncoder(sort_keys=True, separators=(",", ":")).encode
+
 
 @dataclass(frozen=True)
 class SimulationEvaluator:
-    """Deterministic wrapper around an adapter that returns objective + metrics."""
+    """Deterministic wrapper around an adapter that returns objective + metrics.
+
+    With ``cache_size > 0``, results are memoized in memory by ``(config hash, seed)``
+    and the least recently used entries are evicted beyond ``cache_size``. Cached
+    results are returned as-is, so callers must not mutate them. Cache access is
+    guarded by a lock, so one evaluator can be shared by executor threads.
+    """
 
     adapter: Adapter
+    cache_size: int = 0
+    _cache: OrderedDict[tuple[str, int], EvalResult] = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.cache_size < 0:
+            msg = "cache_size must be >= 0"
+            raise ValueError(msg)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Locks cannot be pickled; process-pool workers get a fresh one.
+        state = dict(self.__dict__)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        object.__setattr__(self, "_lock", threading.Lock())
 
     def evaluate(self, config: dict[str, Any], seed: int) -> EvalResult:
         """Run one deterministic simulation evaluation."""
-        return self.adapter.run(config=config, seed=seed)
+        key = self._cache_key(config, seed)
+        if key is None:
+            return self.adapter.run(config=config, seed=seed)
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        # The adapter runs unlocked so concurrent misses still evaluate in parallel.
+        result = self.adapter.run(config=config, seed=seed)
+        with self._lock:
+            self._cache[key] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def evaluate_batch(
+        self,
+        configs: Sequence[dict[str, Any]],
+        seeds: Sequence[int],
+    ) -> list[EvalResult]:
+        """Run aligned config/seed pairs, using the adapter's ``run_batch`` when available."""
+        if len(configs) != len(seeds):
+            msg = (
+                "evaluate_batch requires one seed per config, "
+                f"got {len(configs)} and {len(seeds)}"
+            )
+            raise ValueError(msg)
+        run_batch = getattr(self.adapter, "run_batch", None)
+        if run_batch is None:
+            return [
+                self.evaluate(config=config, seed=seed)
+                for config, seed in zip(configs, seeds, strict=True)
+            ]
+        results = list(run_batch(configs, seeds))
+        if len(results) != len(configs):
+            msg = f"Adapter run_batch returned {len(results)} results for {len(configs)} configs"
+            raise ValueError(msg)
+        return results
 
     def objective_and_metrics(
         self,
@@ -28,5 +104,15 @@ class SimulationEvaluator:
         result = self.evaluate(config=config, seed=seed)
         return result.objective, dict(result.metrics)
 
+    def _cache_key(self, config: dict[str, Any], seed: int) -> tuple[str, int] | None:
+        if self.cache_size == 0:
+            return None
+        try:
+            encoded = _encode_key(config)
+        except (TypeError, ValueError):
+            # Configs that are not JSON-serializable are evaluated without caching.
+            return None
+        return (hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest(), seed)
+
 
 __all__ = ["SimulationEvaluator"]
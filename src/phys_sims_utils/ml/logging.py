@@ -8,48 +8,59 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from phys_sims_utils.harness.reporting import save_summary
 from phys_sims_utils.shared import EvalResult
 
+# Same options as json.dumps(sort_keys=True), built once instead of per call.
+_encode_json = json.JSONEncoder(sort_keys=True).encode
+
+_CSV_FIELDS = (
+    "iteration",
+    "objective",
+    "best_objective",
+    "seed",
+    "theta",
+    "metrics",
+    "artifacts",
+    "timestamp",
+    "config_hash",
+    "provenance",
+)
+
 
 @dataclass
 class OptimizationLogger:
-    """Write per-evaluation optimization logs as JSONL and CSV."""
+    """Write per-evaluation optimization logs as JSONL and CSV.
+
+    Trace rows are flushed every ``flush_every`` evaluations and on ``close``;
+    best-so-far snapshots are flushed as soon as they are written.
+    """
 
     output_dir: Path
     run_name: str = "optimization"
     run_metadata: dict[str, Any] = field(default_factory=dict)
+    flush_every: int = 64
 
     def __post_init__(self) -> None:
+        if self.flush_every <= 0:
+            msg = f"flush_every must be positive, got {self.flush_every}"
+            raise ValueError(msg)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.jsonl_path = self.output_dir / f"{self.run_name}.jsonl"
         self.csv_path = self.output_dir / f"{self.run_name}.csv"
         self.best_path = self.output_dir / f"{self.run_name}.best.jsonl"
         self.metadata_path = self.output_dir / f"{self.run_name}.metadata.json"
 
-        self.metadata_path.write_text(
-            json.dumps(self.run_metadata, sort_keys=True, indent=2),
-            encoding="utf-8",
-        )
+        save_summary(self.run_metadata, self.metadata_path)
 
         self._jsonl = self.jsonl_path.open("w", encoding="utf-8")
         self._best_jsonl = self.best_path.open("w", encoding="utf-8")
         self._csv = self.csv_path.open("w", encoding="utf-8", newline="")
 
-        fieldnames = [
-            "iteration",
-            "objective",
-            "best_objective",
-            "seed",
-            "theta",
-            "metrics",
-            "artifacts",
-            "timestamp",
-            "config_hash",
-            "provenance",
-        ]
-        self._writer = csv.DictWriter(self._csv, fieldnames=fieldnames)
-        self._writer.writeheader()
+        self._writer = csv.writer(self._csv)
+        self._writer.writerow(_CSV_FIELDS)
         self._best_objective: float | None = None
+        self._pending = 0
 
     def log_evaluation(self, iteration: int, result: EvalResult, best: EvalResult | None) -> None:
         """Append one evaluation row and a best-so-far snapshot when improved."""
@@ -67,23 +78,34 @@ class OptimizationLogger:
             "provenance": dict(result.provenance),
         }
 
-        self._jsonl.write(json.dumps(payload, sort_keys=True) + "\n")
-        self._jsonl.flush()
-
-        csv_row = {
-            **payload,
-            "theta": json.dumps(payload["theta"], sort_keys=True),
-            "metrics": json.dumps(payload["metrics"], sort_keys=True),
-            "artifacts": json.dumps(payload["artifacts"], sort_keys=True),
-            "provenance": json.dumps(payload["provenance"], sort_keys=True),
-        }
-        self._writer.writerow(csv_row)
-        self._csv.flush()
+        line = _encode_json(payload) + "\n"
+        self._jsonl.write(line)
+
+        # Cells in _CSV_FIELDS order; nested mappings are stored as sorted JSON strings.
+        self._writer.writerow(
+            (
+                iteration,
+                result.objective,
+                best_objective,
+                result.seed,
+                _encode_json(payload["theta"]),
+                _encode_json(payload["metrics"]),
+                _encode_json(payload["artifacts"]),
+                payload["timestamp"],
+                result.config_hash,
+                _encode_json(payload["provenance"]),
+            )
+        )
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self._jsonl.flush()
+            self._csv.flush()
+            self._pending = 0
 
         is_new_best = self._best_objective is None or result.objective <= self._best_objective
         if is_new_best:
             self._best_objective = result.objective
-            self._best_jsonl.write(json.dumps(payload, sort_keys=True) + "\n")
+            self._best_jsonl.write(line)
             self._best_jsonl.flush()
 
     def close(self) -> None:
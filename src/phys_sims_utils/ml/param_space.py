@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, MutableMapping, Sequence
-from copy import deepcopy
-from dataclasses import dataclass, is_dataclass
+from collections.abc import Callable, Iterable, MutableMapping, Sequence
+from copy import copy, deepcopy
+from dataclasses import dataclass, field, is_dataclass
 from typing import Any, Protocol, cast
 
 
@@ -31,6 +31,10 @@ class Parameter:
     choices: tuple[ParameterValue, ...] | None = None
     transform: ParameterTransform | TransformTuple | None = None
     path: str | None = None
+    _segments: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _choice_positions: dict[Any, int] | None = field(init=False, repr=False, compare=False)
+    _encode_fn: Callable[[float], float] | None = field(init=False, repr=False, compare=False)
+    _decode_fn: Callable[[float], float] | None = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if self.bounds is None and self.choices is None:
@@ -47,6 +51,13 @@ class Parameter:
         if self.choices is not None and len(self.choices) == 0:
             msg = f"Parameter '{self.name}' choices must not be empty"
             raise ValueError(msg)
+        # Split once so encode/decode walk a prebuilt segment tuple.
+        object.__setattr__(self, "_segments", tuple(self.resolved_path.split(".")))
+        object.__setattr__(self, "_choice_positions", _choice_positions(self.choices))
+        # Resolve the transform's shape once instead of branching on every call.
+        encode_fn, decode_fn = _transform_functions(self.transform)
+        object.__setattr__(self, "_encode_fn", encode_fn)
+        object.__setattr__(self, "_decode_fn", decode_fn)
 
     @property
     def resolved_path(self) -> str:
@@ -55,46 +66,44 @@ class Parameter:
 
     def to_encoded(self, value: ParameterValue) -> float:
         """Convert config-space value to encoded optimizer value."""
-        self.validate(value)
         if self.choices is not None:
-            return float(self.choices.index(value))
+            return float(self._choice_position(value))
+        self.validate(value)
         if not isinstance(value, (int, float)):
             msg = f"Parameter '{self.name}' requires numeric values"
             raise ValueError(msg)
         numeric_value = float(value)
-        if self.transform is None:
-            return numeric_value
-        if isinstance(self.transform, tuple):
-            return self.transform[0](numeric_value)
-        return self.transform.encode(numeric_value)
+        encode_fn = self._encode_fn
+        return numeric_value if encode_fn is None else encode_fn(numeric_value)
 
     def from_encoded(self, value: float) -> ParameterValue:
         """Convert encoded optimizer value to config-space value."""
         if self.choices is not None:
-            index = int(round(value))
-            if index < 0 or index >= len(self.choices):
-                msg = (
-                    f"Parameter '{self.name}' categorical index out of bounds: "
-                    f"{index} not in [0, {len(self.choices) - 1}]"
-                )
-                raise ValueError(msg)
-            return self.choices[index]
+            # round() on a float already returns an int (ties to even).
+            index = round(value)
+            if 0 <= index < len(self.choices):
+                return self.choices[index]
+            msg = (
+                f"Parameter '{self.name}' categorical index out of bounds: "
+                f"{index} not in [0, {len(self.choices) - 1}]"
+            )
+            raise ValueError(msg)
 
-        if self.transform is None:
+        decode_fn = self._decode_fn
+        if decode_fn is None:
+            # Plain bounded numeric values skip the generic validate() dispatch.
+            if self.bounds is not None and self.bounds[0] <= value <= self.bounds[1]:
+                return value
             decoded = value
-        elif isinstance(self.transform, tuple):
-            decoded = self.transform[1](value)
         else:
-            decoded = self.transform.decode(value)
+            decoded = decode_fn(value)
         self.validate(decoded)
         return decoded
 
     def validate(self, value: ParameterValue) -> None:
         """Validate a config-space value against inclusive bounds."""
         if self.choices is not None:
-            if value not in self.choices:
-                msg = f"Parameter '{self.name}' invalid categorical choice: {value!r}"
-                raise ValueError(msg)
+            self._choice_position(value)
             return
 
         if self.bounds is None:
@@ -113,6 +122,18 @@ class Parameter:
             )
             raise ValueError(msg)
 
+    def _choice_position(self, value: Any) -> int:
+        positions = self._choice_positions
+        try:
+            if positions is not None:
+                return positions[value]
+            if self.choices is not None:
+                return self.choices.index(value)
+        except (KeyError, TypeError, ValueError):
+            pass
+        msg = f"Parameter '{self.name}' invalid categorical choice: {value!r}"
+        raise ValueError(msg)
+
     def sample(self, *, rng: Any) -> ParameterValue:
         """Draw one deterministic sample in config space."""
         if self.choices is not None:
@@ -136,14 +157,22 @@ class ParameterSpace:
     def encode(self, config: Any) -> tuple[float, ...]:
         """Encode config object values in parameter order."""
         return tuple(
-            parameter.to_encoded(_get_by_path(config, parameter.resolved_path))
+            parameter.to_encoded(_get_by_path(config, parameter._segments))
             for parameter in self.parameters
         )
 
-    def decode(self, encoded: Sequence[float], base: Any | None = None) -> Any:
+    def decode(
+        self,
+        encoded: Sequence[float],
+        base: Any | None = None,
+        *,
+        share_unchanged: bool = False,
+    ) -> Any:
         """Decode encoded vector into a new config object.
 
         ``base`` is deep-copied before updates so decode is side-effect safe.
+        With ``share_unchanged=True`` only the nodes on parameter paths are
+        shallow-copied; untouched subtrees are shared with ``base``.
         """
         if len(encoded) != len(self.parameters):
             msg = (
@@ -152,23 +181,54 @@ class ParameterSpace:
             )
             raise ValueError(msg)
 
-        config: Any = deepcopy(base) if base is not None else {}
+        if base is not None and share_unchanged:
+            return _copy_on_write(
+                base,
+                (
+                    (parameter._segments, parameter.from_encoded(float(value)))
+                    for parameter, value in zip(self.parameters, encoded, strict=True)
+                ),
+            )
+
+        config: Any = _copy_base(base) if base is not None else {}
         for index, parameter in enumerate(self.parameters):
             value = parameter.from_encoded(float(encoded[index]))
-            config = _set_by_path(config, parameter.resolved_path, value)
+            config = _set_by_path(config, parameter._segments, value)
         return config
 
 
-def _get_by_path(obj: Any, path: str) -> Any:
+def _transform_functions(
+    transform: ParameterTransform | TransformTuple | None,
+) -> tuple[Callable[[float], float] | None, Callable[[float], float] | None]:
+    if transform is None:
+        return None, None
+    if isinstance(transform, tuple):
+        return transform
+    return transform.encode, transform.decode
+
+
+def _choice_positions(choices: tuple[Any, ...] | None) -> dict[Any, int] | None:
+    if choices is None:
+        return None
+    positions: dict[Any, int] = {}
+    try:
+        for index, choice in enumerate(choices):
+            # setdefault keeps the first match, as tuple.index does (e.g. 1 vs True).
+            positions.setdefault(choice, index)
+    except TypeError:  # unhashable choices fall back to tuple.index
+        return None
+    return positions
+
+
+def _get_by_path(obj: Any, segments: tuple[str, ...]) -> Any:
     current = obj
-    for segment in path.split("."):
+    for segment in segments:
         current = _get_segment(current, segment)
     return current
 
 
-def _set_by_path(obj: Any, path: str, value: Any) -> Any:
-    parts = path.split(".")
-    if not parts:
+def _set_by_path(obj: Any, segments: tuple[str, ...], value: Any) -> Any:
+    if not segments:
         msg = "Path must not be empty"
         raise ValueError(msg)
 
@@ -178,19 +238,52 @@ def _set_by_path(obj: Any, path: str, value: Any) -> Any:
         root = obj
 
     current = root
-    for segment in parts[:-1]:
+    for segment in segments[:-1]:
         next_obj = _try_get_segment(current, segment)
         if next_obj is None:
             next_obj = {}
             _assign_segment(current, segment, next_obj)
         current = next_obj
 
-    _assign_segment(current, parts[-1], value)
+    _assign_segment(current, segments[-1], value)
+    return root
+
+
+# Leaf types that deepcopy returns unchanged, so a flat dict of them only needs dict.copy().
+_ATOMIC_TYPES = frozenset({bool, int, float, complex, str, bytes, type(None)})
+
+
+def _copy_base(base: Any) -> Any:
+    if type(base) is dict and all(type(value) in _ATOMIC_TYPES for value in base.values()):
+        return base.copy()
+    return deepcopy(base)
+
+
+def _copy_on_write(base: Any, updates: Iterable[tuple[tuple[str, ...], Any]]) -> Any:
+    root = copy(base)
+    # ids of nodes already copied in this call; the copies stay alive via ``root``.
+    copied = {id(root)}
+    for segments, value in updates:
+        current = root
+        for segment in segments[:-1]:
+            child = _try_get_segment(current, segment)
+            if child is None:
+                child = {}
+            elif id(child) in copied:
+                current = child
+                continue
+            else:
+                child = copy(child)
+            _assign_segment(current, segment, child)
+            copied.add(id(child))
+            current = child
+        _assign_segment(current, segments[-1], value)
     return root
 
 
 def _get_segment(obj: Any, segment: str) -> Any:
-    if isinstance(obj, MutableMapping):
+    # Exact-dict check first: plain dict nodes skip the much slower ABC isinstance check.
+    if type(obj) is dict or isinstance(obj, MutableMapping):
         return obj[segment]
     if hasattr(obj, segment):
         return getattr(obj, segment)
@@ -199,7 +292,7 @@ def _get_segment(obj: Any, segment: str) -> Any:
 
 
 def _try_get_segment(obj: Any, segment: str) -> Any | None:
-    if isinstance(obj, MutableMapping):
+    if type(obj) is dict or isinstance(obj, MutableMapping):
         return obj.get(segment)
     if hasattr(obj, segment):
         return getattr(obj, segment)
@@ -207,7 +300,7 @@ def _try_get_segment(obj: Any, segment: str) -> Any | None:
 
 
 def _assign_segment(obj: Any, segment: str, value: Any) -> None:
-    if isinstance(obj, MutableMapping):
+    if type(obj) is dict or isinstance(obj, MutableMapping):
         obj[segment] = value
         return
 
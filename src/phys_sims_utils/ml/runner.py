@@ -2,18 +2,41 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass, field
+import hashlib
+import json
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field, replace
 
 from phys_sims_utils.ml.evaluator import SimulationEvaluator
 from phys_sims_utils.ml.logging import OptimizationLogger
 from phys_sims_utils.ml.strategies.base import OptimizerStrategy
 from phys_sims_utils.shared import EvalResult, OptimizationHistory, Theta
 
+# Theta keys never leave the process, so a 128-bit blake2b digest is enough here.
+_encode_key = json.JSONEncoder(sort_keys=True, separators=(",", ":")).encode
+
 
 @dataclass
 class OptimizationRunner:
-    """Run ask/tell optimization loops with deterministic bookkeeping."""
+    """Run ask/tell optimization loops with deterministic bookkeeping.
+
+    When ``executor`` is set, each batch of asked candidates is evaluated
+    concurrently through it; results are told and recorded in ask order, so
+    histories match a serial run.
+
+    With ``reuse_duplicate_thetas`` enabled, a candidate whose theta was already
+    evaluated successfully reuses that result instead of calling the evaluator again.
+    The reused record carries the new evaluation seed and ``artifacts["from_cache"]``.
+    Only enable it for evaluators whose output does not depend on the seed. At most
+    ``reuse_capacity`` results are kept, evicting the least recently used.
+
+    Callable evaluators receive a copy of each theta; set ``theta_copy=False`` to pass
+    the candidate's dict directly when the evaluator never mutates it.
+
+    Strategies that also provide ``ask_batch(n)`` and ``tell_batch(results)`` are
+    driven one whole batch at a time; convergence is then checked between batches.
+    """
 
     strategy: OptimizerStrategy | None = None
     evaluator: SimulationEvaluator | Callable[[Theta, int], EvalResult] | None = None
@@ -21,10 +44,22 @@ class OptimizationRunner:
     penalty_objective: float = 1.0e12
     history: list[EvalResult] = field(default_factory=list)
     logger: OptimizationLogger | None = None
+    executor: Executor | None = None
+    reuse_duplicate_thetas: bool = False
+    reuse_capacity: int = 4096
+    theta_copy: bool = True
+    _seen: dict[str, EvalResult] = field(default_factory=dict, init=False, repr=False)
+    _best: EvalResult | None = field(default=None, init=False, repr=False)
+    _best_scanned: int = field(default=0, init=False, repr=False)
+    # The list each cache was built from; ``history`` is public and may be reassigned.
+    _best_source: list[EvalResult] | None = field(default=None, init=False, repr=False)
+    _snapshot: OptimizationHistory | None = field(default=None, init=False, repr=False)
+    _snapshot_source: list[EvalResult] | None = field(default=None, init=False, repr=False)
 
     def record(self, result: EvalResult) -> None:
         """Record one evaluation and optionally forward it to a logger."""
         self.history.append(result)
+        self._snapshot = None
         if self.logger is not None:
             self.logger.log_evaluation(
                 iteration=len(self.history) - 1,
@@ -35,12 +70,36 @@ class OptimizationRunner:
     @property
     def best(self) -> EvalResult | None:
         """Current best objective in history."""
-        return min(self.history, key=lambda item: item.objective) if self.history else None
+        # Fold only records appended since the last call; a replaced or shrunken list is rescanned.
+        history = self.history
+        if history is not self._best_source or len(history) < self._best_scanned:
+            self._best, self._best_scanned, self._best_source = None, 0, history
+        best = self._best
+        for item in history[self._best_scanned :]:
+            if best is None or item.objective < best.objective:
+                best = item
+        self._best, self._best_scanned = best, len(history)
+        return best
 
     @property
     def result(self) -> OptimizationHistory:
-        """Optimization history snapshot."""
-        return OptimizationHistory(evaluations=tuple(self.history), best=self.best, seed=self.seed)
+        """Optimization history snapshot.
+
+        The snapshot is reused until ``record`` is called or ``history`` is replaced or
+        changes length.
+        """
+        snapshot = self._snapshot
+        if (
+            snapshot is None
+            or self._snapshot_source is not self.history
+            or len(snapshot.evaluations) != len(self.history)
+            or snapshot.seed != self.seed
+        ):
+            snapshot = OptimizationHistory(
+                evaluations=tuple(self.history), best=self.best, seed=self.seed
+            )
+            self._snapshot, self._snapshot_source = snapshot, self.history
+        return snapshot
 
     def run(self, iterations: int, batch_size: int = 1) -> OptimizationHistory:
         """Run an optimization loop for the requested number of iterations."""
@@ -50,48 +109,149 @@ class OptimizationRunner:
         if batch_size <= 0:
             msg = "batch_size must be > 0"
             raise ValueError(msg)
+        if self.reuse_duplicate_thetas and self.reuse_capacity <= 0:
+            msg = "reuse_capacity must be > 0"
+            raise ValueError(msg)
         if self.strategy is None or self.evaluator is None:
             msg = "OptimizationRunner.run requires both strategy and evaluator"
             raise ValueError(msg)
 
+        ask_batch = getattr(self.strategy, "ask_batch", None)
+        tell_batch = getattr(self.strategy, "tell_batch", None)
         while len(self.history) < iterations and not self.strategy.is_converged:
             remaining = iterations - len(self.history)
             current_batch = min(batch_size, remaining)
-            candidates = [self.strategy.ask() for _ in range(current_batch)]
+            if ask_batch is not None:
+                candidates = ask_batch(current_batch)
+            else:
+                candidates = [self.strategy.ask() for _ in range(current_batch)]
+            if not candidates:
+                break
+            base_seed = self.seed + len(self.history)
+            results = self._evaluate_batch(
+                [candidate.theta for candidate in candidates],
+                [base_seed + index for index in range(len(candidates))],
+            )
 
-            for candidate in candidates:
-                eval_seed = self.seed + len(self.history)
-                result = self._safe_evaluate(theta=candidate.theta, seed=eval_seed)
+            if tell_batch is not None:
+                # Batch-aware strategies update once per generation, so the whole
+                # batch is evaluated, told and recorded together.
+                batch = list(results)
+                tell_batch(batch)
+                for result in batch:
+                    self.record(result)
+                continue
+
+            # The batch never exceeds the remaining iterations, so only convergence can
+            # end it early; per-result checks keep max_iterations limits exact.
+            for result in results:
                 self.strategy.tell(result)
                 self.record(result)
-                if self.strategy.is_converged or len(self.history) >= iterations:
+                if self.strategy.is_converged:
                     break
 
         if self.logger is not None:
             self.logger.close()
         return self.result
 
-    def _safe_evaluate(self, theta: Theta, seed: int) -> EvalResult:
-        evaluator = self.evaluator
-        if evaluator is None:
-            msg = "OptimizationRunner has no evaluator"
-            raise ValueError(msg)
+    def _evaluate_batch(self, thetas: list[Theta], seeds: list[int]) -> Iterable[EvalResult]:
+        keys = [self._theta_key(theta) for theta in thetas]
+        if self.executor is None:
+            # Lazy so a mid-batch convergence stop skips the remaining evaluations.
+            return (
+                self._reuse(key, seed) or self._evaluate_new(key, theta, seed)
+                for key, theta, seed in zip(keys, thetas, seeds, strict=True)
+            )
+        # Submit everything before collecting so candidates run concurrently; results are
+        # gathered in submission order to keep tell/record deterministic.
+        pending: list[EvalResult | Future[EvalResult]] = [
+            self._reuse(key, seed)
+            or self.executor.submit(
+                _safe_evaluate,
+                self.evaluator,
+                theta,
+                seed,
+                penalty_objective=self.penalty_objective,
+                theta_copy=self.theta_copy,
+            )
+            for key, theta, seed in zip(keys, thetas, seeds, strict=True)
+        ]
+        results = []
+        for key, item in zip(keys, pending, strict=True):
+            if isinstance(item, Future):
+                item = item.result()
+                self._remember(key, item)
+            results.append(item)
+        return results
+
+    def _evaluate_new(self, key: str | None, theta: Theta, seed: int) -> EvalResult:
+        result = self._safe_evaluate(theta=theta, seed=seed)
+        self._remember(key, result)
+        return result
 
+    def _theta_key(self, theta: Theta) -> str | None:
+        if not self.reuse_duplicate_thetas:
+            return None
         try:
-            if isinstance(evaluator, SimulationEvaluator):
-                return evaluator.evaluate(config=theta, seed=seed)
-            return evaluator(dict(theta), seed)
-        except Exception as exc:  # noqa: BLE001 - convert failures to penalties
-            return EvalResult(
-                theta=dict(theta),
-                objective=self.penalty_objective,
-                metrics={"penalty": 1.0},
-                artifacts={
-                    "error": str(exc),
-                    "error_type": type(exc).__name__,
-                },
-                seed=seed,
-            )
+            encoded = _encode_key(theta)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _reuse(self, key: str | None, seed: int) -> EvalResult | None:
+        if key is None:
+            return None
+        cached = self._seen.pop(key, None)
+        if cached is None:
+            return None
+        self._seen[key] = cached  # re-insert as most recently used
+        return replace(cached, seed=seed, artifacts={**cached.artifacts, "from_cache": True})
+
+    def _remember(self, key: str | None, result: EvalResult) -> None:
+        # Penalty records may come from transient failures, so they are always re-evaluated.
+        if key is not None and "error_type" not in result.artifacts:
+            self._seen.pop(key, None)
+            self._seen[key] = result
+            if len(self._seen) > self.reuse_capacity:
+                del self._seen[next(iter(self._seen))]
+
+    def _safe_evaluate(self, theta: Theta, seed: int) -> EvalResult:
+        return _safe_evaluate(
+            self.evaluator,
+            theta,
+            seed,
+            penalty_objective=self.penalty_objective,
+            theta_copy=self.theta_copy,
+        )
+
+
+def _safe_evaluate(
+    evaluator: SimulationEvaluator | Callable[[Theta, int], EvalResult] | None,
+    theta: Theta,
+    seed: int,
+    *,
+    penalty_objective: float,
+    theta_copy: bool = True,
+) -> EvalResult:
+    if evaluator is None:
+        msg = "OptimizationRunner has no evaluator"
+        raise ValueError(msg)
+
+    try:
+        if isinstance(evaluator, SimulationEvaluator):
+            return evaluator.evaluate(config=theta, seed=seed)
+        return evaluator(dict(theta) if theta_copy else theta, seed)
+    except Exception as exc:  # noqa: BLE001 - convert failures to penalties
+        return EvalResult(
+            theta=dict(theta),
+            objective=penalty_objective,
+            metrics={"penalty": 1.0},
+            artifacts={
+                "error": str(exc),
+                "error_type": type(exc).__name__,
+            },
+            seed=seed,
+        )
 
 
 __all__ = ["OptimizationRunner"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from importlib import import_module
 from typing import Any
@@ -10,24 +11,53 @@ from phys_sims_utils.ml.param_space import ParameterSpace
 from phys_sims_utils.ml.strategies.base import OptimizerStrategy
 from phys_sims_utils.shared import Candidate, EvalResult, OptimizationHistory
 
-try:  # pragma: no cover - availability is environment dependent
-    _cma: Any = import_module("cma")
-except ImportError:  # pragma: no cover - availability is environment dependent
-    _cma = None
+# ``cma`` pulls in scipy.stats and matplotlib, so it is imported on first use rather
+# than when the strategies package is imported. ``None`` means unavailable.
+_NOT_LOADED: Any = object()
+_cma: Any = _NOT_LOADED
+
+
+def _require_cma() -> Any:
+    global _cma
+    if _cma is _NOT_LOADED:
+        try:  # pragma: no cover - availability is environment dependent
+            _cma = import_module("cma")
+        except ImportError:  # pragma: no cover - availability is environment dependent
+            _cma = None
+    return _cma
+
+
+def _seeded_randn(seed: int) -> Any:
+    # A private generator per strategy; cma would otherwise reseed and share ``numpy.random``.
+    # numpy is always importable here because cma depends on it.
+    generator = import_module("numpy").random.default_rng(seed)
+
+    def randn(*shape: int) -> Any:
+        return generator.standard_normal(shape)
+
+    return randn
 
 
 @dataclass
 class CMAESStrategy(OptimizerStrategy):
-    """CMA-ES strategy guarded behind the optional ``cma`` dependency."""
+    """CMA-ES strategy guarded behind the optional ``cma`` dependency.
+
+    Told results are buffered and passed to CMA-ES one full population at a time,
+    so single ``tell`` calls and partial batches are both supported.
+    """
 
     parameter_space: ParameterSpace
     seed: int = 0
     sigma0: float | None = None
     max_iterations: int | None = None
     _history: list[EvalResult] = field(default_factory=list)
+    _bounds: tuple[tuple[str, float, float], ...] = field(default=(), init=False, repr=False)
+    _names: tuple[str, ...] = field(default=(), init=False, repr=False)
+    _pending: list[EvalResult] = field(default_factory=list, init=False, repr=False)
 
     def __post_init__(self) -> None:
-        if _cma is None:
+        cma = _require_cma()
+        if cma is None:
             msg = (
                 "CMAESStrategy requires the optional 'cma' package. "
                 "Install it with 'pip install phys-sims-utils[ml] cma'."
@@ -55,6 +85,13 @@ class CMAESStrategy(OptimizerStrategy):
                 )
                 raise ValueError(msg)
 
+        self._bounds = tuple(
+            (parameter.name, lower, upper)
+            for parameter, lower, upper in zip(
+                self.parameter_space.parameters, lowers, uppers, strict=True
+            )
+        )
+        self._names = tuple(name for name, _, _ in self._bounds)
         x0 = [(lower + upper) / 2.0 for lower, upper in zip(lowers, uppers, strict=True)]
         if self.sigma0 is None:
             avg_span = sum((upper - lower) for lower, upper in zip(lowers, uppers, strict=True))
@@ -62,35 +99,61 @@ class CMAESStrategy(OptimizerStrategy):
 
         options = {
             "bounds": [lowers, uppers],
-            "seed": self.seed,
+            # NaN tells cma not to touch the global RNG; sampling uses ``randn``.
+            "seed": float("nan"),
+            "randn": _seeded_randn(self.seed),
             "verbose": -9,
             "verb_log": 0,
         }
-        self._optimizer = _cma.CMAEvolutionStrategy(x0, self.sigma0, options)
+        self._optimizer = cma.CMAEvolutionStrategy(x0, self.sigma0, options)
 
     def ask(self) -> Candidate:
-        encoded = self._optimizer.ask(1)[0]
-        theta: dict[str, float] = {}
-        for index, parameter in enumerate(self.parameter_space.parameters):
-            if parameter.bounds is None:
-                msg = (
-                    "CMAESStrategy requires bounded numeric parameters; "
-                    f"'{parameter.name}' is categorical"
-                )
-                raise ValueError(msg)
-            lower, upper = parameter.bounds
-            value = float(encoded[index])
-            clipped = min(max(value, lower), upper)
-            theta[parameter.name] = clipped
-        return Candidate(theta=theta)
+        return self._to_candidate(self._optimizer.ask(1)[0])
+
+    def ask_batch(self, n: int) -> list[Candidate]:
+        """Ask up to ``n`` candidates from a single CMA-ES sampling call.
+
+        The batch is capped at the evaluations left before ``max_iterations``.
+        """
+        if self.max_iterations is not None:
+            n = min(n, self.max_iterations - len(self._history))
+        if n <= 0:
+            return []
+        return [self._to_candidate(encoded) for encoded in self._optimizer.ask(n)]
 
     def tell(self, result: EvalResult) -> None:
-        encoded = [
-            float(result.theta[parameter.name])
-            for parameter in self.parameter_space.parameters
-        ]
-        self._optimizer.tell([encoded], [float(result.objective)])
-        self._history.append(result)
+        self.tell_batch([result])
+
+    def tell_batch(self, results: Sequence[EvalResult]) -> None:
+        """Record results and update CMA-ES once per completed population."""
+        self._history.extend(results)
+        pending = self._pending
+        pending.extend(results)
+        population_size = self.population_size
+        while len(pending) >= population_size:
+            generation = pending[:population_size]
+            del pending[:population_size]
+            self._optimizer.tell(
+                [[float(result.theta[name]) for name in self._names] for result in generation],
+                [float(result.objective) for result in generation],
+            )
+
+    @property
+    def population_size(self) -> int:
+        """CMA-ES population size; a natural ``batch_size`` for the runner."""
+        return int(self._optimizer.popsize)
+
+    def _to_candidate(self, encoded: Any) -> Candidate:
+        # One tolist() converts the whole array to Python floats, so clipping below
+        # compares plain floats instead of NumPy scalars.
+        return Candidate(
+            theta={
+                name: min(max(value, lower), upper)
+                for (name, lower, upper), value in zip(
+                    self._bounds, encoded.tolist(), strict=True
+                )
+            }
+        )
 
     @property
     def is_converged(self) -> bool:
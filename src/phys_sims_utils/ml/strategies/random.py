@@ -18,6 +18,7 @@ class RandomStrategy(OptimizerStrategy):
     seed: int = 0
     max_iterations: int | None = None
     _history: list[EvalResult] = field(default_factory=list)
+    _best: EvalResult | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         if self.parameter_space is None:
@@ -27,6 +28,8 @@ class RandomStrategy(OptimizerStrategy):
                 parameters=(Parameter(name="x", bounds=(0.0, 1.0)),)
             )
         self._rng = random.Random(self.seed)
+        if self._history:
+            self._best = min(self._history, key=lambda item: item.objective)
 
     def ask(self) -> Candidate:
         parameter_space = self.parameter_space
@@ -41,6 +44,9 @@ class RandomStrategy(OptimizerStrategy):
 
     def tell(self, result: EvalResult) -> None:
         self._history.append(result)
+        # Strict < keeps the earliest of tied objectives, matching min() over the history.
+        if self._best is None or result.objective < self._best.objective:
+            self._best = result
 
     @property
     def is_converged(self) -> bool:
@@ -48,8 +54,9 @@ class RandomStrategy(OptimizerStrategy):
 
     @property
     def result(self) -> OptimizationHistory:
-        best = min(self._history, key=lambda item: item.objective) if self._history else None
-        return OptimizationHistory(evaluations=tuple(self._history), best=best, seed=self.seed)
+        return OptimizationHistory(
+            evaluations=tuple(self._history), best=self._best, seed=self.seed
+        )
 
 
 __all__ = ["RandomStrategy"]
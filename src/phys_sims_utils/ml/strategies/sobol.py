@@ -3,15 +3,27 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from importlib import import_module
+from typing import Any
 
 from phys_sims_utils.ml.param_space import ParameterSpace
 from phys_sims_utils.ml.strategies.base import OptimizerStrategy
 from phys_sims_utils.shared import Candidate, EvalResult, OptimizationHistory
 
-try:  # pragma: no cover - availability is environment dependent
-    from scipy.stats import qmc  # type: ignore[import-untyped]
-except ImportError:  # pragma: no cover - availability is environment dependent
-    qmc = None
+# ``scipy.stats`` is slow to import, so it is loaded on first use. ``None`` means
+# unavailable.
+_NOT_LOADED: Any = object()
+qmc: Any = _NOT_LOADED
+
+
+def _require_qmc() -> Any:
+    global qmc
+    if qmc is _NOT_LOADED:
+        try:  # pragma: no cover - availability is environment dependent
+            qmc = import_module("scipy.stats.qmc")
+        except ImportError:  # pragma: no cover - availability is environment dependent
+            qmc = None
+    return qmc
 
 
 @dataclass
@@ -24,17 +36,24 @@ class SobolStrategy(OptimizerStrategy):
     _history: list[EvalResult] = field(default_factory=list)
 
     def __post_init__(self) -> None:
-        if qmc is None:
+        engine_module = _require_qmc()
+        if engine_module is None:
             msg = "SobolStrategy requires scipy. Install phys-sims-utils[ml] with scipy."
             raise RuntimeError(msg)
-        self._engine = qmc.Sobol(
+        self._engine = engine_module.Sobol(
             d=len(self.parameter_space.parameters),
             scramble=True,
             seed=self.seed,
         )
 
     def ask(self) -> Candidate:
-        sample = self._engine.random(1)[0]
+        return self._to_candidate(self._engine.random(1)[0])
+
+    def ask_batch(self, n: int) -> list[Candidate]:
+        """Draw ``n`` consecutive Sobol points with a single engine call."""
+        return [self._to_candidate(sample) for sample in self._engine.random(n)]
+
+    def _to_candidate(self, sample: Any) -> Candidate:
         theta = {}
         for index, parameter in enumerate(self.parameter_space.parameters):
             if parameter.bounds is None:
@@ -3,15 +3,21 @@
 from __future__ import annotations
 
 import json
+import math
 from collections.abc import Mapping
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta, timezone
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
 Numeric = float
 Theta = dict[str, Any]
 
+# Same output as json.dumps(..., sort_keys=True) without building an encoder per call.
+_encode_sorted_json = json.JSONEncoder(sort_keys=True).encode
+
 
 @dataclass(frozen=True)
 class Candidate:
@@ -97,35 +103,50 @@ class SweepResult:
             msg = "to_dataframe requires pandas"
             raise RuntimeError(msg) from exc
 
-        rows = [_evaluation_to_row(item) for item in self.evaluations]
-        return pd.DataFrame(rows)
+        return pd.DataFrame(_evaluation_columns(self.evaluations), copy=False)
 
     def save(self, path: str | Path) -> Path:
-        """Persist sweep results as CSV by default and parquet when requested."""
+        """Persist sweep results as CSV by default, or by suffix as parquet/feather.
+
+        ``.parquet`` and ``.feather`` destinations are written columnar through pandas
+        (pyarrow backend); any other suffix writes CSV without extra dependencies.
+        """
         destination = Path(path)
         destination.parent.mkdir(parents=True, exist_ok=True)
 
         suffix = destination.suffix.lower()
         if suffix == ".parquet":
-            frame = self.to_dataframe()
-            frame.to_parquet(destination, index=False)
+            self.to_dataframe().to_parquet(destination, index=False)
+            return destination
+        if suffix == ".feather":
+            self.to_dataframe().to_feather(destination)
             return destination
 
         if suffix == "":
             destination = destination.with_suffix(".csv")
 
-        rows = [_evaluation_to_row(item) for item in self.evaluations]
-        if not rows:
+        rows = map(_evaluation_to_row, self.evaluations)
+        first = next(rows, None)
+        if first is None:
             destination.write_text("", encoding="utf-8")
             return destination
 
         import csv
 
-        fieldnames = sorted(rows[0].keys())
+        fieldnames = sorted(first.keys())
+        columns = frozenset(fieldnames)
+        cells = itemgetter(*fieldnames)
         with destination.open("w", encoding="utf-8", newline="") as handle:
-            writer = csv.DictWriter(handle, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
+            # Rows are built and written one at a time, so memory stays flat for large
+            # sweeps. Rows with exactly the header's keys skip DictWriter's field checks.
+            writer = csv.writer(handle)
+            dict_writer = csv.DictWriter(handle, fieldnames=fieldnames)
+            writer.writerow(fieldnames)
+            for row in chain((first,), rows):
+                if row.keys() == columns:
+                    writer.writerow(cells(row))
+                else:
+                    dict_writer.writerow(row)
         return destination
 
 
@@ -171,6 +192,20 @@ class OptimizationHistory:
         )
 
 
+def _evaluation_columns(evaluations: tuple[EvalResult, ...]) -> dict[str, list[Any]]:
+    # Columns appear in first-seen order and missing cells are NaN, matching what
+    # pandas infers from a list of row dicts without it re-scanning every row.
+    columns: dict[str, list[Any]] = {}
+    count = len(evaluations)
+    for index, evaluation in enumerate(evaluations):
+        for key, value in _evaluation_to_row(evaluation).items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = [math.nan] * count
+            column[index] = value
+    return columns
+
+
 def _evaluation_to_row(result: EvalResult) -> dict[str, Any]:
     row: dict[str, Any] = {
         "objective": result.objective,
@@ -182,8 +217,8 @@ def _evaluation_to_row(result: EvalResult) -> dict[str, Any]:
         row[f"theta.{key}"] = result.theta[key]
     for key in sorted(result.metrics):
         row[f"metric.{key}"] = result.metrics[key]
-    row["artifacts"] = json.dumps(result.artifacts, sort_keys=True)
-    row["provenance"] = json.dumps(result.provenance, sort_keys=True)
+    row["artifacts"] = _encode_sorted_json(result.artifacts)
+    row["provenance"] = _encode_sorted_json(result.provenance)
     return row
 
 
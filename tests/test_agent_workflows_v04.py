@@ -81,6 +81,8 @@ def test_strategy_advisor_contract_and_fallbacks(tmp_path: Path) -> None:
 
     assert response.recommended == ("staged[sobol,cmaes]",)
     assert response.fallbacks == ("random",)
+    manifest_text = (tmp_path / "manifest.json").read_text(encoding="utf-8")
+    assert manifest_text == json.dumps(response.manifest.to_dict(), sort_keys=True, indent=2)
 
 
 def test_strategy_advisor_rejects_invalid_budget(tmp_path: Path) -> None:
@@ -166,3 +168,44 @@ def test_graphics_concierge_rejects_unsupported_intent(tmp_path: Path) -> None:
                 output_dir=(tmp_path / "bad").as_posix(),
             )
         )
+
+
+def test_graphics_concierge_renders_multiple_slices_in_one_figure(tmp_path: Path) -> None:
+    matplotlib = pytest.importorskip("matplotlib")
+    matplotlib.use("Agg", force=True)
+
+    sweep = SweepResult(
+        evaluations=tuple(
+            EvalResult(theta={"alpha": a, "beta": b}, objective=a + b, seed=index)
+            for index, (a, b) in enumerate(((0.0, 1.0), (0.5, 0.5), (1.0, 0.0)))
+        ),
+        seed=3,
+        parameter_space=("alpha", "beta"),
+    )
+    result_path = tmp_path / "sweep.json"
+    result_path.write_text(json.dumps(sweep.to_dict(), sort_keys=True), encoding="utf-8")
+
+    response = run_graphics_concierge(
+        GraphicsConciergeRequest(
+            result_path=result_path.as_posix(),
+            result_type="sweep",
+            intents=(GraphicsIntent(kind="objective_slices_1d", parameters=("alpha", "beta")),),
+            output_dir=(tmp_path / "artifacts").as_posix(),
+            seed=3,
+        )
+    )
+
+    (artifact,) = response.manifest.artifacts
+    assert artifact.name == "objective-slices-1d"
+    assert Path(artifact.path).name == "objective_slices_alpha_beta.png"
+    assert Path(artifact.path).exists()
+
+    with pytest.raises(AgentWorkflowError, match="missing-parameters"):
+        run_graphics_concierge(
+            GraphicsConciergeRequest(
+                result_path=result_path.as_posix(),
+                result_type="sweep",
+                intents=(GraphicsIntent(kind="objective_slices_1d"),),
+                output_dir=(tmp_path / "empty").as_posix(),
+            )
+        )
@@ -12,6 +12,7 @@ from phys_sims_utils.agents import (
     check_script_metadata,
     generate_experiment_script,
 )
+from phys_sims_utils.agents.experiment_gen import _safe_filename
 
 GOLDEN_DIR = Path(__file__).parent / "golden" / "agents"
 
@@ -37,6 +38,11 @@ def test_generate_experiment_script_matches_golden(tmp_path: Path) -> None:
     assert generated == expected
 
 
+def test_safe_filename_replaces_unsafe_ascii_and_keeps_unicode_letters() -> None:
+    assert _safe_filename("pulse sweep/v2.final-run_a") == "pulse_sweep_v2_final-run_a"
+    assert _safe_filename("héllo–wörld") == "héllo_wörld"
+
+
 def test_repo_checks_report_missing_seed_hash_and_invalid_paths() -> None:
     result = check_script_metadata(
         GOLDEN_DIR / "invalid_script.py",
@@ -83,3 +89,42 @@ def test_sim_introspection_report_is_deterministic() -> None:
         hint.startswith("Document module src/phys_sims_utils/")
         for hint in report_a.doc_hints
     )
+
+
+def test_sim_introspection_reparses_modules_after_edits(tmp_path: Path) -> None:
+    module_path = tmp_path / "src" / "phys_sims_utils" / "widget.py"
+    module_path.parent.mkdir(parents=True)
+    (tmp_path / "tests").mkdir()
+    module_path.write_text("def a() -> None:\n    pass\n", encoding="utf-8")
+
+    before = build_introspection_report(tmp_path)
+    module_path.write_text(
+        "class Widget:\n    pass\n\n\ndef a() -> None:\n    pass\n\n\ndef b() -> None:\n    pass\n",
+        encoding="utf-8",
+    )
+    after = build_introspection_report(tmp_path)
+
+    assert before.doc_hints == (
+        "Document module src/phys_sims_utils/widget.py: classes=0, functions=1.",
+    )
+    assert after.doc_hints == (
+        "Document module src/phys_sims_utils/widget.py: classes=1, functions=2.",
+    )
+
+
+def test_repo_checks_report_invalid_python_with_or_without_parameter_paths(tmp_path: Path) -> None:
+    undeclared = tmp_path / "undeclared.py"
+    undeclared.write_text("def broken(:\n", encoding="utf-8")
+    declared = tmp_path / "declared.py"
+    declared.write_text('PARAMETER_PATHS = ("a",)\ndef broken(:\n', encoding="utf-8")
+
+    undeclared_codes = [
+        issue.code
+        for issue in check_script_metadata(undeclared, valid_parameter_paths={"a"}).issues
+    ]
+    declared_codes = [
+        issue.code for issue in check_script_metadata(declared, valid_parameter_paths={"a"}).issues
+    ]
+
+    assert "invalid-python" in undeclared_codes
+    assert "invalid-python" in declared_codes
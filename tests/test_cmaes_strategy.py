@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 import pytest
 
 import phys_sims_utils.ml.strategies.cmaes as cmaes_module
-from phys_sims_utils.ml import Parameter, ParameterSpace
+from phys_sims_utils.ml import OptimizationRunner, Parameter, ParameterSpace
 from phys_sims_utils.ml.strategies.cmaes import CMAESStrategy
 from phys_sims_utils.shared import EvalResult
 
@@ -76,3 +76,69 @@ def test_cmaes_strategy_tell_updates_history_and_convergence() -> None:
     assert history.best is not None
     assert history.best.objective == min(item.objective for item in history.evaluations)
     assert strategy.is_converged
+
+
+def test_cmaes_strategy_single_tells_update_once_per_population() -> None:
+    pytest.importorskip("cma")
+    parameter_space = ParameterSpace(
+        parameters=(
+            Parameter("x", bounds=(-1.0, 1.0)),
+            Parameter("y", bounds=(0.0, 2.0)),
+        )
+    )
+    strategy = CMAESStrategy(parameter_space=parameter_space, seed=6)
+    population = strategy.population_size
+
+    for index in range(2 * population + 1):
+        theta = strategy.ask().theta
+        strategy.tell(EvalResult(theta=theta, objective=theta["x"] ** 2 + theta["y"] ** 2))
+        assert len(strategy.result.evaluations) == index + 1
+
+    assert strategy._optimizer.countiter == 2
+    assert len(strategy._pending) == 1
+
+
+def test_cmaes_strategy_batches_full_generations_through_runner() -> None:
+    pytest.importorskip("cma")
+    parameter_space = ParameterSpace(
+        parameters=(
+            Parameter("x", bounds=(-1.0, 1.0)),
+            Parameter("y", bounds=(0.0, 2.0)),
+        )
+    )
+    strategy = CMAESStrategy(parameter_space=parameter_space, seed=4)
+    population = strategy.population_size
+
+    def objective(theta: dict[str, float], seed: int) -> EvalResult:
+        return EvalResult(theta=theta, objective=theta["x"] ** 2 + (theta["y"] - 1.0) ** 2)
+
+    runner = OptimizationRunner(strategy=strategy, evaluator=objective, seed=4)
+    history = runner.run(iterations=3 * population, batch_size=population)
+
+    assert len(history.evaluations) == 3 * population
+    assert len(strategy.result.evaluations) == 3 * population
+    for evaluation in history.evaluations:
+        assert -1.0 <= evaluation.theta["x"] <= 1.0
+        assert 0.0 <= evaluation.theta["y"] <= 2.0
+
+
+def test_cmaes_runner_batches_stop_at_strategy_max_iterations() -> None:
+    pytest.importorskip("cma")
+    parameter_space = ParameterSpace(
+        parameters=(
+            Parameter("x", bounds=(-1.0, 1.0)),
+            Parameter("y", bounds=(0.0, 2.0)),
+        )
+    )
+    strategy = CMAESStrategy(parameter_space=parameter_space, seed=2, max_iterations=3)
+
+    def objective(theta: dict[str, float], seed: int) -> EvalResult:
+        return EvalResult(theta=theta, objective=theta["x"] ** 2 + theta["y"] ** 2, seed=seed)
+
+    runner = OptimizationRunner(strategy=strategy, evaluator=objective, seed=2)
+    history = runner.run(iterations=20, batch_size=6)
+
+    assert len(history.evaluations) == 3
+    assert [evaluation.seed for evaluation in history.evaluations] == [2, 3, 4]
+    assert len(strategy.result.evaluations) == 3
+    assert strategy.ask_batch(6) == []
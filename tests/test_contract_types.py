@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from datetime import datetime, timedelta, timezone
 
 from phys_sims_utils.harness import (
@@ -11,6 +12,7 @@ from phys_sims_utils.harness import (
     SweepSpec,
 )
 from phys_sims_utils.harness.adapters import Adapter
+from phys_sims_utils.harness.metrics import aggregate_metrics
 from phys_sims_utils.ml import OptimizationRunner
 from phys_sims_utils.ml.strategies import RandomSearchStrategy
 from phys_sims_utils.shared import (
@@ -78,6 +80,50 @@ def test_harness_specs_and_in_memory_harness() -> None:
     assert [item.seed for item in results.evaluations] == [11, 12]
 
 
+def test_in_memory_harness_computes_each_metric_once_and_aggregates() -> None:
+    calls: list[float] = []
+
+    def doubled(result: EvalResult) -> float:
+        calls.append(result.objective)
+        return 2.0 * result.objective
+
+    results = InMemoryTestHarness(name="test").run_sweep(
+        adapter=_DummyAdapter(),
+        base_config={},
+        sweep_spec=SweepSpec(parameters={"alpha": (1.0, 2.0, 4.0)}, mode="grid"),
+        metric_spec=(
+            MetricSpec(name="doubled", compute=doubled, aggregate="max"),
+            MetricSpec(name="rmse"),
+        ),
+        seed=0,
+    )
+
+    assert calls == [1.0, 2.0, 4.0]
+    assert [item.metrics["doubled"] for item in results.evaluations] == [2.0, 4.0, 8.0]
+    assert json.loads(results.provenance["metric_aggregate"]) == {
+        "doubled": 8.0,
+        "rmse": 10.0 / 3.0,
+    }
+
+
+def test_mean_aggregate_is_exactly_rounded() -> None:
+    # statistics.fmean returns ...268 for these values; persisted summaries pin ...267.
+    values = [
+        0.7579544029403025,
+        0.420571580830845,
+        0.25891675029296335,
+        0.5112747213686085,
+        0.4049341374504143,
+    ]
+    evaluations = tuple(
+        EvalResult(theta={}, objective=0.0, metrics={"m": value}) for value in values
+    )
+
+    aggregate = aggregate_metrics(evaluations, (MetricSpec("m"),))
+
+    assert aggregate == {"m": 0.4707303185766267}
+
+
 def test_optimizer_strategy_and_runner_consume_shared_types() -> None:
     strategy = RandomSearchStrategy(seed=3)
     candidate = strategy.ask()
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pytest
+
 from phys_sims_utils.ml import OptimizationLogger, OptimizationRunner, Parameter, ParameterSpace
 from phys_sims_utils.ml.strategies import RandomStrategy
-from phys_sims_utils.shared import EvalResult
+from phys_sims_utils.shared import Candidate, EvalResult, OptimizationHistory
 
 
 def _quadratic_objective(theta: dict[str, float], seed: int) -> EvalResult:
@@ -40,6 +43,53 @@ def test_runner_tracks_best_point_with_batching() -> None:
     assert result.best.objective == min(item.objective for item in result.evaluations)
 
 
+def test_runner_best_tracks_prepopulated_and_recorded_history() -> None:
+    first = EvalResult(theta={"x": 0.1}, objective=0.5, seed=0)
+    tie = EvalResult(theta={"x": 0.2}, objective=0.5, seed=1)
+    runner = OptimizationRunner(history=[first])
+
+    assert runner.best is first
+    runner.record(tie)
+    assert runner.best is first
+    runner.record(EvalResult(theta={"x": 0.3}, objective=0.1, seed=2))
+    assert runner.best is not None and runner.best.objective == 0.1
+    runner.history.clear()
+    assert runner.best is None
+
+
+def test_runner_best_and_result_follow_replaced_history() -> None:
+    runner = OptimizationRunner(history=[EvalResult(theta={"x": 0.1}, objective=0.1)])
+    assert runner.best is not None and runner.best.objective == 0.1
+    assert runner.result.best is runner.best
+
+    replacement = [
+        EvalResult(theta={"x": 0.2}, objective=0.4),
+        EvalResult(theta={"x": 0.3}, objective=0.3),
+    ]
+    runner.history = replacement
+    assert runner.best is replacement[1]
+    assert runner.result.evaluations == tuple(replacement)
+
+    same_length = [EvalResult(theta={"x": 0.4}, objective=0.9)] * 2
+    runner.history = same_length
+    assert runner.best is same_length[0]
+    assert runner.result.evaluations == tuple(same_length)
+
+
+def test_runner_result_snapshot_is_reused_until_history_changes() -> None:
+    runner = OptimizationRunner(history=[EvalResult(theta={"x": 0.1}, objective=0.5)])
+
+    snapshot = runner.result
+    assert runner.result is snapshot
+    runner.record(EvalResult(theta={"x": 0.2}, objective=0.2))
+    updated = runner.result
+    assert updated is not snapshot
+    assert len(updated.evaluations) == 2
+    assert updated.best is not None and updated.best.objective == 0.2
+    runner.history.pop()
+    assert len(runner.result.evaluations) == 1
+
+
 def test_runner_maps_exceptions_to_penalty() -> None:
     parameter_space = ParameterSpace(parameters=(Parameter("x", bounds=(0.0, 1.0)),))
 
@@ -65,6 +115,21 @@ def test_runner_maps_exceptions_to_penalty() -> None:
     assert all(item.artifacts.get("error_type") == "RuntimeError" for item in penalties)
 
 
+def test_random_strategy_result_tracks_earliest_best() -> None:
+    seeded = _quadratic_objective({"x": 0.9}, 0)
+    strategy = RandomStrategy(seed=1, _history=[seeded])
+    assert strategy.result.best is seeded
+
+    first_tie = _quadratic_objective({"x": 0.0}, 1)
+    second_tie = _quadratic_objective({"x": 0.5}, 2)
+    for result in (first_tie, second_tie):
+        strategy.tell(result)
+
+    history = strategy.result
+    assert history.best is first_tie
+    assert len(history.evaluations) == 3
+
+
 def test_logger_writes_jsonl_csv_and_best_snapshots(tmp_path: Path) -> None:
     parameter_space = ParameterSpace(parameters=(Parameter("x", bounds=(0.0, 1.0)),))
     logger = OptimizationLogger(
@@ -92,3 +157,145 @@ def test_logger_writes_jsonl_csv_and_best_snapshots(tmp_path: Path) -> None:
     assert len(jsonl_lines) == 5
     assert len(csv_lines) == 6
     assert len(best_lines) >= 1
+
+
+def test_logger_flushes_trace_rows_in_batches(tmp_path: Path) -> None:
+    logger = OptimizationLogger(output_dir=tmp_path, run_name="batched", flush_every=3)
+    result = _quadratic_objective({"x": 0.5}, 0)
+
+    for iteration in range(2):
+        logger.log_evaluation(iteration, result, result)
+    assert (tmp_path / "batched.jsonl").read_text(encoding="utf-8") == ""
+    assert len((tmp_path / "batched.best.jsonl").read_text(encoding="utf-8").splitlines()) == 2
+
+    logger.log_evaluation(2, result, result)
+    assert len((tmp_path / "batched.jsonl").read_text(encoding="utf-8").splitlines()) == 3
+    assert len((tmp_path / "batched.csv").read_text(encoding="utf-8").splitlines()) == 4
+
+    logger.log_evaluation(3, result, result)
+    logger.close()
+    assert len((tmp_path / "batched.jsonl").read_text(encoding="utf-8").splitlines()) == 4
+
+
+def test_logger_rejects_non_positive_flush_interval(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="flush_every"):
+        OptimizationLogger(output_dir=tmp_path, flush_every=0)
+
+
+def test_runner_with_executor_matches_serial_history() -> None:
+    parameter_space = ParameterSpace(parameters=(Parameter("x", bounds=(0.0, 1.0)),))
+
+    serial = OptimizationRunner(
+        strategy=RandomStrategy(parameter_space=parameter_space, seed=5),
+        evaluator=_quadratic_objective,
+        seed=50,
+    ).run(iterations=7, batch_size=3)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        parallel = OptimizationRunner(
+            strategy=RandomStrategy(parameter_space=parameter_space, seed=5),
+            evaluator=_quadratic_objective,
+            seed=50,
+            executor=executor,
+        ).run(iterations=7, batch_size=3)
+
+    def _key(history: OptimizationHistory) -> list[tuple[dict[str, float], float, int]]:
+        return [(item.theta, item.objective, item.seed) for item in history.evaluations]
+
+    assert _key(parallel) == _key(serial)
+    assert [item.seed for item in parallel.evaluations] == list(range(50, 57))
+
+
+def test_runner_reuses_results_for_duplicate_thetas() -> None:
+    parameter_space = ParameterSpace(parameters=(Parameter("x", bounds=(0.0, 1.0)),))
+    calls: list[int] = []
+
+    def counting(theta: dict[str, float], seed: int) -> EvalResult:
+        calls.append(seed)
+        return _quadratic_objective(theta, seed)
+
+    class RepeatingStrategy(RandomStrategy):
+        def ask(self) -> Candidate:
+            return Candidate(theta={"x": 0.5})
+
+    runner = OptimizationRunner(
+        strategy=RepeatingStrategy(parameter_space=parameter_space, seed=1),
+        evaluator=counting,
+        seed=20,
+        reuse_duplicate_thetas=True,
+    )
+
+    result = runner.run(iterations=3)
+
+    assert calls == [20]
+    assert [item.seed for item in result.evaluations] == [20, 21, 22]
+    assert [item.artifacts.get("from_cache") for item in result.evaluations] == [
+        None,
+        True,
+        True,
+    ]
+    assert len({item.objective for item in result.evaluations}) == 1
+
+
+def test_runner_reuse_cache_evicts_least_recently_used() -> None:
+    parameter_space = ParameterSpace(parameters=(Parameter("x", bounds=(0.0, 1.0)),))
+    calls: list[float] = []
+
+    def counting(theta: dict[str, float], seed: int) -> EvalResult:
+        calls.append(theta["x"])
+        return _quadratic_objective(theta, seed)
+
+    class CyclingStrategy(RandomStrategy):
+        def ask(self) -> Candidate:
+            sequence = (0.1, 0.2, 0.1, 0.3, 0.2, 0.1)
+            return Candidate(theta={"x": sequence[len(self._history) % len(sequence)]})
+
+    runner = OptimizationRunner(
+        strategy=CyclingStrategy(parameter_space=parameter_space, seed=1),
+        evaluator=counting,
+        reuse_duplicate_thetas=True,
+        reuse_capacity=2,
+    )
+
+    runner.run(iterations=6)
+
+    assert calls == [0.1, 0.2, 0.3, 0.2, 0.1]
+
+
+def test_runner_theta_copy_flag_controls_evaluator_input() -> None:
+    parameter_space = ParameterSpace(parameters=(Parameter("x", bounds=(0.0, 1.0)),))
+    received: list[dict[str, float]] = []
+
+    def capturing(theta: dict[str, float], seed: int) -> EvalResult:
+        received.append(theta)
+        return _quadratic_objective(theta, seed)
+
+    class FixedStrategy(RandomStrategy):
+        candidate = Candidate(theta={"x": 0.5})
+
+        def ask(self) -> Candidate:
+            return self.candidate
+
+    for theta_copy in (True, False):
+        received.clear()
+        OptimizationRunner(
+            strategy=FixedStrategy(parameter_space=parameter_space, seed=1),
+            evaluator=capturing,
+            theta_copy=theta_copy,
+        ).run(iterations=1)
+        assert (received[0] is FixedStrategy.candidate.theta) is not theta_copy
+
+
+def test_sobol_ask_batch_matches_sequential_asks() -> None:
+    pytest.importorskip("scipy")
+    from phys_sims_utils.ml.strategies.sobol import SobolStrategy
+
+    parameter_space = ParameterSpace(
+        parameters=(Parameter("x", bounds=(0.0, 1.0)), Parameter("y", bounds=(-2.0, 2.0)))
+    )
+    sequential = SobolStrategy(parameter_space=parameter_space, seed=8)
+    batched = SobolStrategy(parameter_space=parameter_space, seed=8)
+
+    expected = [sequential.ask().theta for _ in range(6)]
+    actual = [candidate.theta for candidate in batched.ask_batch(4) + batched.ask_batch(2)]
+
+    assert actual == expected
@@ -95,6 +95,36 @@ def test_nested_path_assignment_correctness() -> None:
             assert base.model.value == 0.0
 
 
+def test_decode_share_unchanged_copies_only_parameter_paths() -> None:
+    base = {
+        "model": {"alpha": 1.0, "beta": 0.5},
+        "solver": {"tolerances": [1e-6, 1e-8]},
+        "outer": OuterConfig(),
+        "container": ContainerLike(),
+    }
+    parameter_space = ParameterSpace(
+        parameters=(
+            Parameter(name="alpha", bounds=(0.0, 3.0), path="model.alpha"),
+            Parameter(name="beta", bounds=(0.0, 3.0), path="model.beta"),
+            Parameter(name="inner", bounds=(0.0, 3.0), path="outer.inner.alpha"),
+            Parameter(name="value", bounds=(0.0, 3.0), path="container.model.value"),
+        )
+    )
+
+    shared = parameter_space.decode((2.0, 1.5, 0.25, 0.75), base=base, share_unchanged=True)
+    copied = parameter_space.decode((2.0, 1.5, 0.25, 0.75), base=base)
+
+    assert shared["model"] == {"alpha": 2.0, "beta": 1.5}
+    assert shared["outer"].inner.alpha == 0.25
+    assert shared["container"].model.value == 0.75
+    assert shared["solver"] is base["solver"]
+    assert copied["solver"] is not base["solver"]
+    assert parameter_space.encode(shared) == parameter_space.encode(copied)
+    assert base["model"] == {"alpha": 1.0, "beta": 0.5}
+    assert base["outer"].inner.alpha == 0.0
+    assert base["container"].model.value == 0.0
+
+
 def test_mixed_parameter_space_round_trip_with_categorical_values() -> None:
     parameter_space = ParameterSpace(
         parameters=(
@@ -120,3 +150,17 @@ def test_parameter_rejects_invalid_categorical_choice() -> None:
         raise AssertionError("Expected categorical validation to fail")
     except ValueError as exc:
         assert "invalid categorical choice" in str(exc)
+
+
+def test_categorical_encode_matches_first_equal_choice_and_rejects_unhashable() -> None:
+    parameter = Parameter(name="mode", choices=(1, True, "two", 2.5))
+
+    assert parameter.to_encoded(True) == 0.0
+    assert parameter.to_encoded("two") == 2.0
+    assert parameter.to_encoded(2.5) == 3.0
+
+    try:
+        parameter.to_encoded(["two"])  # type: ignore[arg-type]
+        raise AssertionError("Expected categorical validation to fail")
+    except ValueError as exc:
+        assert "invalid categorical choice" in str(exc)
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+import pickle
+from collections.abc import Mapping, Sequence
 from typing import Any
 from unittest import mock
 
+import pytest
+
 import phys_sims_utils.harness.adapters.phys_pipeline as phys_adapter_module
+from phys_sims_utils.harness import InMemoryTestHarness, SweepSpec
 from phys_sims_utils.harness.adapters.phys_pipeline import PhysPipelineAdapter
 
 
@@ -52,7 +56,7 @@ def test_adapter_extracts_additional_metrics() -> None:
         pipeline=lambda seed: _DummyPipeline(seed_bias=int(seed)),
         objective_key="objective",
         metric_extractors={
-            "rmse": lambda output: float(output["rmse"]),
+            "rmse": "rmse",
             "throughput": lambda output: 1000.0 / float(output["latency_ms"]),
         },
     )
@@ -64,6 +68,84 @@ def test_adapter_extracts_additional_metrics() -> None:
     assert abs(result.metrics["throughput"] - 121.95121951219512) < 1e-12
 
 
+def test_adapter_cache_pipelines_reuses_factory_output_per_seed() -> None:
+    built: list[int] = []
+
+    def factory(seed: int) -> _DummyPipeline:
+        built.append(seed)
+        return _DummyPipeline(seed_bias=seed)
+
+    cached = PhysPipelineAdapter(pipeline=factory, objective_key="objective", cache_pipelines=True)
+    for seed in (1, 2, 1, 2):
+        cached.run(config={"alpha": 0.1}, seed=seed)
+    assert built == [1, 2]
+
+    built.clear()
+    uncached = PhysPipelineAdapter(pipeline=factory, objective_key="objective")
+    for seed in (1, 1):
+        uncached.run(config={"alpha": 0.1}, seed=seed)
+    assert built == [1, 1]
+
+
+def test_adapter_pipeline_cache_evicts_least_recently_used_seed() -> None:
+    built: list[int] = []
+
+    def factory(seed: int) -> _DummyPipeline:
+        built.append(seed)
+        return _DummyPipeline(seed_bias=seed)
+
+    adapter = PhysPipelineAdapter(
+        pipeline=factory, objective_key="objective", cache_pipelines=True, pipeline_cache_size=2
+    )
+    for seed in (1, 2, 1, 3, 1, 2):
+        adapter.run(config={"alpha": 0.1}, seed=seed)
+
+    assert built == [1, 2, 3, 2]
+
+
+def test_adapter_rejects_non_positive_pipeline_cache_size() -> None:
+    with pytest.raises(ValueError, match="pipeline_cache_size"):
+        PhysPipelineAdapter(
+            pipeline=_DummyPipeline,
+            objective_key="objective",
+            cache_pipelines=True,
+            pipeline_cache_size=0,
+        )
+
+
+def test_adapter_binds_fixed_pipeline_call_once() -> None:
+    class _EvaluateOnly:
+        def evaluate(self, config: Mapping[str, Any], seed: int, /) -> Mapping[str, Any]:
+            return {"objective": float(config["alpha"]) + seed}
+
+    adapter = PhysPipelineAdapter(pipeline=_EvaluateOnly(), objective_key="objective")
+    with mock.patch.object(
+        phys_adapter_module,
+        "_bind_pipeline_call",
+        wraps=phys_adapter_module._bind_pipeline_call,
+    ) as bind:
+        results = [adapter.run(config={"alpha": 0.5}, seed=seed) for seed in (1, 2, 3)]
+
+    assert [result.objective for result in results] == [1.5, 2.5, 3.5]
+    assert bind.call_count == 1
+
+
+class _PositionalPipeline:
+    def evaluate(self, config: Mapping[str, Any], seed: int, /) -> Mapping[str, Any]:
+        return {"objective": float(config["alpha"]) + seed}
+
+
+def test_adapter_pickles_after_binding_pipeline_call() -> None:
+    for pipeline in (_DummyPipeline(seed_bias=1), _PositionalPipeline()):
+        adapter = PhysPipelineAdapter(pipeline=pipeline, objective_key="objective")
+        before = adapter.run(config={"alpha": 0.5}, seed=3)
+
+        restored = pickle.loads(pickle.dumps(adapter))
+
+        after = restored.run(config={"alpha": 0.5}, seed=3)
+        assert (after.objective, after.theta) == (before.objective, before.theta)
+
+
 def test_adapter_missing_objective_key_raises_clear_error() -> None:
     adapter = PhysPipelineAdapter(
         pipeline=_DummyPipeline(),
@@ -92,3 +174,47 @@ def test_adapter_default_pipeline_missing_optional_dependency_raises_clear_error
         else:  # pragma: no cover - defensive branch for explicit failure signal
             msg = "Expected ImportError for missing phys-pipeline"
             raise AssertionError(msg)
+
+
+class _BatchPipeline(_DummyPipeline):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batch_calls = 0
+
+    def run_batch(
+        self, configs: Sequence[Mapping[str, Any]], seeds: Sequence[int]
+    ) -> list[Mapping[str, Any]]:
+        self.batch_calls += 1
+        return [self.run(config, seed) for config, seed in zip(configs, seeds, strict=True)]
+
+
+def test_adapter_run_batch_delegates_to_pipeline_batch_method() -> None:
+    pipeline = _BatchPipeline()
+    adapter = PhysPipelineAdapter(
+        pipeline=pipeline,
+        objective_key="objective",
+        metric_extractors={"rmse": lambda output: float(output["rmse"])},
+    )
+    configs = [{"alpha": 0.5, "beta": 0.2}, {"alpha": 1.0, "beta": 0.4}]
+
+    batched = adapter.run_batch(configs, [7, 8])
+    single = [adapter.run(config=configs[0], seed=7), adapter.run(config=configs[1], seed=8)]
+
+    assert pipeline.batch_calls == 1
+    assert [item.objective for item in batched] == [item.objective for item in single]
+    assert [item.metrics for item in batched] == [item.metrics for item in single]
+    assert [item.seed for item in batched] == [7, 8]
+
+
+def test_harness_uses_adapter_run_batch_for_sweeps() -> None:
+    pipeline = _BatchPipeline()
+    adapter = PhysPipelineAdapter(pipeline=pipeline, objective_key="objective")
+    spec = SweepSpec(parameters={"alpha": (0.1, 0.2), "beta": (0.0, 1.0)}, mode="grid")
+
+    result = InMemoryTestHarness(name="batch").run_sweep(adapter, {}, spec, seed=4)
+
+    assert pipeline.batch_calls == 1
+    assert [item.seed for item in result.evaluations] == [4, 5, 6, 7]
+    assert [item.objective for item in result.evaluations] == [
+        adapter.run(config=item.theta, seed=item.seed).objective for item in result.evaluations
+    ]
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import pickle
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from phys_sims_utils.harness.adapters import Adapter
@@ -22,3 +27,102 @@ def test_simulation_evaluator_exposes_objective_and_metrics() -> None:
 
     assert objective == 5.0
     assert metrics == {"m": 2.5}
+
+
+class _DummyBatchAdapter(_DummyAdapter):
+    def __init__(self) -> None:
+        self.batch_sizes: list[int] = []
+
+    def run_batch(
+        self, configs: Sequence[dict[str, Any]], seeds: Sequence[int]
+    ) -> list[EvalResult]:
+        self.batch_sizes.append(len(configs))
+        return [self.run(config, seed) for config, seed in zip(configs, seeds, strict=True)]
+
+
+def test_simulation_evaluator_batch_uses_adapter_run_batch() -> None:
+    adapter = _DummyBatchAdapter()
+    evaluator = SimulationEvaluator(adapter=adapter)
+
+    results = evaluator.evaluate_batch([{"alpha": 1.0}, {"alpha": 2.0}], seeds=[3, 4])
+
+    assert adapter.batch_sizes == [2]
+    assert [item.objective for item in results] == [2.0, 4.0]
+    assert [item.seed for item in results] == [3, 4]
+
+
+def test_simulation_evaluator_batch_falls_back_to_single_runs() -> None:
+    evaluator = SimulationEvaluator(adapter=_DummyAdapter())
+
+    results = evaluator.evaluate_batch([{"alpha": 1.0}, {"alpha": 2.0}], seeds=[3, 4])
+
+    assert [item.objective for item in results] == [2.0, 4.0]
+
+
+class _CountingAdapter(_DummyAdapter):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def run(self, config: dict[str, Any], seed: int) -> EvalResult:
+        self.calls += 1
+        return super().run(config, seed)
+
+
+def test_simulation_evaluator_cache_skips_duplicate_config_seed_pairs() -> None:
+    adapter = _CountingAdapter()
+    evaluator = SimulationEvaluator(adapter=adapter, cache_size=2)
+
+    first = evaluator.evaluate({"alpha": 1.0}, seed=1)
+    again = evaluator.evaluate({"alpha": 1.0}, seed=1)
+    other_seed = evaluator.evaluate({"alpha": 1.0}, seed=2)
+
+    assert again is first
+    assert other_seed.seed == 2
+    assert adapter.calls == 2
+
+    evaluator.evaluate({"alpha": 3.0}, seed=1)
+    evaluator.evaluate({"alpha": 1.0}, seed=1)
+    assert adapter.calls == 4
+
+
+def test_simulation_evaluator_cache_is_disabled_by_default() -> None:
+    adapter = _CountingAdapter()
+    evaluator = SimulationEvaluator(adapter=adapter)
+
+    evaluator.evaluate({"alpha": 1.0}, seed=1)
+    evaluator.evaluate({"alpha": 1.0}, seed=1)
+
+    assert adapter.calls == 2
+
+
+class _YieldingCache(OrderedDict[tuple[str, int], EvalResult]):
+    """Cache that sleeps after each lookup to widen the get/move_to_end window."""
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        value = super().get(key, default)
+        time.sleep(0.001)
+        return value
+
+
+def test_simulation_evaluator_cache_is_safe_under_concurrent_calls() -> None:
+    evaluator = SimulationEvaluator(adapter=_DummyAdapter(), cache_size=1)
+    object.__setattr__(evaluator, "_cache", _YieldingCache())
+    alphas = [float(index % 2) for index in range(200)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(lambda alpha: evaluator.evaluate({"alpha": alpha}, seed=0), alphas)
+        )
+
+    assert [result.objective for result in results] == [alpha * 2.0 for alpha in alphas]
+    assert len(evaluator._cache) <= 1
+
+
+def test_simulation_evaluator_with_cache_survives_pickling() -> None:
+    evaluator = SimulationEvaluator(adapter=_DummyAdapter(), cache_size=2)
+    evaluator.evaluate({"alpha": 1.0}, seed=1)
+
+    restored = pickle.loads(pickle.dumps(evaluator))
+
+    assert restored.evaluate({"alpha": 1.0}, seed=1).objective == 2.0
+    assert len(restored._cache) == 1
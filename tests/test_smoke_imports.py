@@ -1,5 +1,10 @@
 """Smoke tests for stable import surfaces."""
 
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 from phys_sims_utils import (
     AgentArtifact,
     EvalResult,
@@ -30,3 +35,20 @@ def test_key_symbols_exported() -> None:
     assert TestHarness is not None
     assert ReportSpec is not None
     assert RandomSearchStrategy is not None
+
+
+def test_package_import_defers_heavy_optional_dependencies() -> None:
+    src_root = Path(__file__).resolve().parents[1] / "src"
+    code = (
+        "import sys; import phys_sims_utils; "
+        "print(sorted(m for m in ('cma', 'matplotlib', 'scipy') if m in sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(src_root)},
+    )
+
+    assert completed.stdout.strip() == "[]"
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import csv
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pytest
+
 from phys_sims_utils.harness import InMemoryTestHarness, SweepSpec
 from phys_sims_utils.harness.adapters import Adapter
-from phys_sims_utils.shared import EvalResult
+from phys_sims_utils.shared import EvalResult, SweepResult
+from phys_sims_utils.shared.types import _evaluation_to_row
 
 
 class QuadraticAdapter(Adapter):
@@ -67,3 +72,69 @@ def test_sweep_result_save_csv(tmp_path: Path) -> None:
     text = destination.read_text(encoding="utf-8")
     assert "objective" in text
     assert "theta.x" in text
+    with destination.open(encoding="utf-8", newline="") as handle:
+        saved = list(csv.DictReader(handle))
+    assert saved == [
+        {key: str(value) for key, value in _evaluation_to_row(item).items()}
+        for item in result.evaluations
+    ]
+
+
+def test_run_sweep_with_executor_matches_serial_order() -> None:
+    spec = SweepSpec(parameters={"x": (0.0, 0.5, 1.0), "y": (10.0, 20.0)}, mode="grid")
+
+    serial = InMemoryTestHarness(name="executor").run_sweep(
+        QuadraticAdapter(), {}, spec, metric_spec=(), seed=3
+    )
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        parallel = InMemoryTestHarness(name="executor", executor=executor).run_sweep(
+            QuadraticAdapter(), {}, spec, metric_spec=(), seed=3
+        )
+
+    assert [item.theta for item in parallel.evaluations] == [
+        item.theta for item in serial.evaluations
+    ]
+    assert [item.objective for item in parallel.evaluations] == [
+        item.objective for item in serial.evaluations
+    ]
+    assert [item.seed for item in parallel.evaluations] == [
+        item.seed for item in serial.evaluations
+    ]
+
+
+def test_sweep_result_to_dataframe_matches_row_construction() -> None:
+    pd = pytest.importorskip("pandas")
+    first = EvalResult(theta={"x": 1.0}, objective=1.0, metrics={"a": 0.5}, seed=1)
+    second = EvalResult(theta={"x": 2.0}, objective=4.0, metrics={"b": 1.5}, seed=2)
+    result = SweepResult(evaluations=(first, second), seed=1)
+
+    frame = result.to_dataframe()
+    expected = pd.DataFrame([_evaluation_to_row(first), _evaluation_to_row(second)])
+
+    pd.testing.assert_frame_equal(frame, expected)
+
+
+def test_sweep_result_save_feather_round_trips(tmp_path: Path) -> None:
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    spec = SweepSpec(parameters={"x": (0.0, 1.0), "y": (0.0, 1.0)}, mode="grid")
+    result = InMemoryTestHarness(name="save").run_sweep(
+        QuadraticAdapter(), {}, spec, metric_spec=(), seed=5
+    )
+
+    destination = result.save(tmp_path / "result.feather")
+
+    pd.testing.assert_frame_equal(pd.read_feather(destination), result.to_dataframe())
+
+
+def test_sweep_result_save_csv_leaves_missing_metrics_blank(tmp_path: Path) -> None:
+    first = EvalResult(theta={"x": 1.0}, objective=1.0, metrics={"a": 0.5, "b": 2.0})
+    second = EvalResult(theta={"x": 2.0}, objective=4.0, metrics={"a": 1.5})
+    result = SweepResult(evaluations=(first, second), seed=1)
+
+    destination = result.save(tmp_path / "ragged.csv")
+
+    with destination.open(encoding="utf-8", newline="") as handle:
+        saved = list(csv.DictReader(handle))
+    assert [row["metric.b"] for row in saved] == ["2.0", ""]
+    assert [row["metric.a"] for row in saved] == ["0.5", "1.5"]